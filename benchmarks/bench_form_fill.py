@@ -0,0 +1,102 @@
+"""
+Per-field vs batched form filling latency against the local ParaBank stub
+
+    python -m benchmarks.bench_form_fill --rounds 10 --browser chrome
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.timing import measure, summarize, format_summary
+from pages.register_page import RegisterPage
+from pages.bill_pay_page import BillPayPage
+from test_data.test_data import TestData
+from utilities.driver_factory import create_driver
+from utilities.stub_server import StubServer
+from utilities.user_provisioning import UserProvisioner
+
+
+def register_fields(page, user_data):
+    return {
+        page.FIRST_NAME_FIELD: user_data['first_name'],
+        page.LAST_NAME_FIELD: user_data['last_name'],
+        page.ADDRESS_FIELD: user_data['address'],
+        page.CITY_FIELD: user_data['city'],
+        page.STATE_FIELD: user_data['state'],
+        page.ZIP_CODE_FIELD: user_data['zip_code'],
+        page.PHONE_FIELD: user_data['phone'],
+        page.SSN_FIELD: user_data['ssn'],
+        page.USERNAME_FIELD: user_data['username'],
+        page.PASSWORD_FIELD: user_data['password'],
+        page.CONFIRM_PASSWORD_FIELD: user_data['password'],
+    }
+
+
+def bill_pay_fields(page, bill_data):
+    return {
+        page.PAYEE_NAME: bill_data['payee_name'],
+        page.PAYEE_ADDRESS: bill_data['payee_address'],
+        page.PAYEE_CITY: bill_data['payee_city'],
+        page.PAYEE_STATE: bill_data['payee_state'],
+        page.PAYEE_ZIP_CODE: bill_data['payee_zip'],
+        page.PAYEE_PHONE: bill_data['payee_phone'],
+        page.PAYEE_ACCOUNT: bill_data['payee_account'],
+        page.VERIFY_ACCOUNT: bill_data['payee_account'],
+        page.AMOUNT: bill_data['amount'],
+    }
+
+
+def fill_per_field(page, fields):
+    """The old way: one wait + clear + send_keys sequence per field"""
+    for locator, text in fields.items():
+        element = page.driver.find_element(*locator)
+        element.clear()
+        element.send_keys(text)
+
+
+def run(rounds, browser):
+    results = {}
+    with StubServer() as server:
+        driver = create_driver(browser)
+        try:
+            register_url = f"{server.base_url}/register.htm"
+            page = RegisterPage(driver)
+            fields = register_fields(page, TestData.get_valid_user_data())
+            reload_register = lambda: page.open(register_url)
+
+            results['register: per-field send_keys'] = summarize(
+                measure(lambda: fill_per_field(page, fields), rounds, reload_register))
+            results['register: batched fill_fields'] = summarize(
+                measure(lambda: page.fill_fields(fields), rounds, reload_register))
+
+            provisioner = UserProvisioner(base_url=server.base_url, seeded_users=[])
+            provisioner.start_logged_in(driver, provisioner.provision(), "billpay.htm")
+            page = BillPayPage(driver)
+            fields = bill_pay_fields(page, TestData.get_valid_bill_pay_data())
+            reload_billpay = lambda: page.open(f"{server.base_url}/billpay.htm")
+
+            results['billpay: per-field send_keys'] = summarize(
+                measure(lambda: fill_per_field(page, fields), rounds, reload_billpay))
+            results['billpay: batched fill_fields'] = summarize(
+                measure(lambda: page.fill_fields(fields), rounds, reload_billpay))
+            provisioner.close()
+        finally:
+            driver.quit()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--browser", default="chrome")
+    args = parser.parse_args()
+
+    for name, summary in run(args.rounds, args.browser).items():
+        print(format_summary(name, summary))
+
+
+if __name__ == "__main__":
+    main()
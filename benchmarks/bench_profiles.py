@@ -0,0 +1,62 @@
+"""
+Page-load time per browser profile
+
+    python -m benchmarks.bench_profiles --rounds 5 --target local
+    python -m benchmarks.bench_profiles --target remote --browser firefox
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.timing import measure, summarize, format_summary
+from utilities.browser_profiles import PROFILES
+from utilities.config_reader import ConfigReader
+from utilities.driver_factory import create_driver
+from utilities.stub_server import StubServer
+
+PAGES = ["index.htm", "register.htm"]
+
+
+def load_times(base_url, browser, profile_name, rounds):
+    driver = create_driver(browser, profile_name)
+    try:
+        results = {}
+        for page in PAGES:
+            url = f"{base_url}/{page}"
+            samples = measure(lambda: driver.get(url), rounds,
+                              before_each=lambda: driver.get("about:blank"))
+            results[f"{profile_name}: {page}"] = summarize(samples)
+        return results
+    finally:
+        driver.quit()
+
+
+def run(rounds, browser, target):
+    results = {}
+    if target == "local":
+        with StubServer() as server:
+            for name in PROFILES:
+                results.update(load_times(server.base_url, browser, name, rounds))
+    else:
+        base_url = ConfigReader().get_base_url()
+        for name in PROFILES:
+            results.update(load_times(base_url, browser, name, rounds))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--browser", default="chrome")
+    parser.add_argument("--target", default="local", choices=["local", "remote"])
+    args = parser.parse_args()
+
+    for name, summary in run(args.rounds, args.browser, args.target).items():
+        print(format_summary(name, summary))
+
+
+if __name__ == "__main__":
+    main()
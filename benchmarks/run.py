@@ -0,0 +1,251 @@
+"""
+Framework overhead benchmarks against the local ParaBank stub
+
+Measures fixture setup cost (cold driver launch vs the pool, ConfigReader
+construction) and the hot page-object methods on the stub's copies of the
+ParaBank forms. Results go to benchmarks/results/latest.json and can be
+checked against a stored baseline:
+
+    python -m benchmarks.run                    # run and compare with baseline.json
+    python -m benchmarks.run --save-baseline    # accept current numbers as the baseline
+    python -m benchmarks.run --no-browser       # only the benchmarks that need no browser
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.timing import measure, summarize, format_summary
+from pages.bill_pay_page import BillPayPage
+from pages.register_page import RegisterPage
+from test_data.test_data import TestData
+from utilities.config_reader import ConfigReader
+from utilities.settings import load_settings
+from utilities.instrumentation import write_json
+from utilities.stub_server import StubServer
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+RESULTS_PATH = os.path.join(BENCH_DIR, "results", "latest.json")
+BASELINE_PATH = os.path.join(BENCH_DIR, "baseline.json")
+
+BENCHMARKS = []
+
+
+def benchmark(name, needs_browser=True):
+    """Register a benchmark function taking a BenchContext and returning duration samples"""
+    def register(func):
+        BENCHMARKS.append((name, needs_browser, func))
+        return func
+    return register
+
+
+class BenchContext:
+    """Shared resources for one benchmark run"""
+
+    def __init__(self, rounds, browser, base_url=None):
+        self.rounds = rounds
+        self.browser = browser
+        self.base_url = base_url
+        self._driver = None
+        self._provisioner = None
+
+    @property
+    def driver(self):
+        if self._driver is None:
+            from utilities.driver_factory import create_driver
+            self._driver = create_driver(self.browser)
+        return self._driver
+
+    @property
+    def provisioner(self):
+        if self._provisioner is None:
+            from utilities.user_provisioning import UserProvisioner
+            self._provisioner = UserProvisioner(base_url=self.base_url, seeded_users=[])
+        return self._provisioner
+
+    def url(self, page):
+        return f"{self.base_url}/{page}"
+
+    def close(self):
+        if self._driver is not None:
+            self._driver.quit()
+        if self._provisioner is not None:
+            self._provisioner.close()
+
+
+def per_call(samples, calls):
+    return [sample / calls for sample in samples]
+
+
+# ============ FIXTURE OVERHEAD ============
+
+@benchmark("config.ConfigReader()", needs_browser=False)
+def bench_config_reader(ctx):
+    calls = 100
+    return per_call(measure(lambda: [ConfigReader() for _ in range(calls)], ctx.rounds), calls)
+
+
+@benchmark("config.load_settings", needs_browser=False)
+def bench_load_settings(ctx):
+    """Uncached parse of config.ini - what every ConfigReader() used to cost"""
+    calls = 100
+    return per_call(measure(lambda: [load_settings() for _ in range(calls)], ctx.rounds), calls)
+
+
+@benchmark("driver.launch_cold")
+def bench_driver_launch(ctx):
+    from utilities.driver_factory import create_driver
+    return measure(lambda: create_driver(ctx.browser).quit(), max(1, ctx.rounds // 3))
+
+
+@benchmark("driver.pool_acquire_warm")
+def bench_driver_pool(ctx):
+    from utilities.driver_factory import create_driver
+    from utilities.driver_pool import DriverPool
+    pool = DriverPool(lambda: create_driver(ctx.browser))
+    pool.release(pool.acquire())
+    try:
+        return measure(lambda: pool.release(pool.acquire()), ctx.rounds)
+    finally:
+        pool.shutdown()
+
+
+# ============ REGISTER PAGE ============
+
+@benchmark("register.register_user")
+def bench_register_user(ctx):
+    page = RegisterPage(ctx.driver)
+    return measure(lambda: page.register_user(TestData.get_valid_user_data()), ctx.rounds,
+                   before_each=lambda: page.open(ctx.url("register.htm")))
+
+
+@benchmark("register.get_error_messages")
+def bench_error_messages(ctx):
+    page = RegisterPage(ctx.driver)
+    page.open(ctx.url("register.htm"))
+    page.click(page.REGISTER_BUTTON)
+    page.wait_for_page_ready()
+    return measure(page.get_error_messages, ctx.rounds)
+
+
+@benchmark("register.get_error_messages_clean_page")
+def bench_error_messages_clean(ctx):
+    page = RegisterPage(ctx.driver)
+    page.open(ctx.url("register.htm"))
+    return measure(page.get_error_messages, ctx.rounds)
+
+
+@benchmark("register.is_registration_successful")
+def bench_registration_successful(ctx):
+    page = RegisterPage(ctx.driver)
+    page.open(ctx.url("register.htm"))
+    page.register_user(TestData.get_valid_user_data())
+    return measure(page.is_registration_successful, ctx.rounds)
+
+
+# ============ BILL PAY PAGE ============
+
+def open_bill_pay(ctx):
+    ctx.provisioner.start_logged_in(ctx.driver, ctx.provisioner.provision(), "billpay.htm")
+    return BillPayPage(ctx.driver).wait_until_ready()
+
+
+@benchmark("billpay.fill_form")
+def bench_bill_pay_fill(ctx):
+    page = open_bill_pay(ctx)
+    return measure(lambda: page.fill_form(TestData.get_valid_bill_pay_data()), ctx.rounds,
+                   before_each=lambda: page.open(ctx.url("billpay.htm")))
+
+
+@benchmark("billpay.is_successful")
+def bench_bill_pay_successful(ctx):
+    page = open_bill_pay(ctx)
+    bill_data = TestData.get_valid_bill_pay_data()
+    bill_data['verify_account'] = bill_data['payee_account']
+    page.fill_form(bill_data).submit()
+    return measure(page.is_successful, ctx.rounds)
+
+
+# ============ RESULTS ============
+
+def run(rounds, browser, include_browser=True, only=None):
+    results = {}
+    with StubServer() as server:
+        ctx = BenchContext(rounds, browser, server.base_url)
+        try:
+            for name, needs_browser, func in BENCHMARKS:
+                if needs_browser and not include_browser:
+                    continue
+                if only and only not in name:
+                    continue
+                results[name] = summarize(func(ctx))
+                print(format_summary(name, results[name]))
+        finally:
+            ctx.close()
+    return results
+
+
+def compare(results, baseline, tolerance, slack_ms):
+    """Benchmarks whose median regressed beyond tolerance, or that have no baseline to compare with"""
+    regressions = []
+    for name, summary in results.items():
+        reference = baseline.get("benchmarks", {}).get(name)
+        if not reference:
+            regressions.append(f"{name}: not in the baseline - run with --save-baseline to record it")
+            continue
+        limit = reference['median_ms'] * (1 + tolerance) + slack_ms
+        if summary['median_ms'] > limit:
+            regressions.append(
+                f"{name}: median {summary['median_ms']:.2f} ms > limit {limit:.2f} ms "
+                f"(baseline {reference['median_ms']:.2f} ms)")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Framework overhead benchmarks")
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--browser", default="chrome")
+    parser.add_argument("--no-browser", action="store_true", help="Skip benchmarks that need a browser")
+    parser.add_argument("-k", dest="only", default=None, help="Only run benchmarks whose name contains this")
+    parser.add_argument("--save-baseline", action="store_true", help="Store results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Allowed relative slowdown against the baseline (default 0.25)")
+    parser.add_argument("--slack-ms", type=float, default=2.0,
+                        help="Absolute slack added to every limit to absorb noise (default 2 ms)")
+    args = parser.parse_args()
+
+    results = run(args.rounds, args.browser, not args.no_browser, args.only)
+    document = {
+        'created': time.strftime("%Y-%m-%dT%H:%M:%S"),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'browser': args.browser,
+        'benchmarks': results,
+    }
+    write_json(RESULTS_PATH, document)
+    print(f"Results written to {RESULTS_PATH}")
+
+    if args.save_baseline:
+        write_json(BASELINE_PATH, document)
+        print(f"Baseline updated: {BASELINE_PATH}")
+        return 0
+
+    if not os.path.exists(BASELINE_PATH):
+        # Nothing to compare with is a failed check, not a pass
+        print(f"No baseline at {BASELINE_PATH} - run with --save-baseline on the reference machine")
+        return 2
+
+    with open(BASELINE_PATH) as f:
+        regressions = compare(results, json.load(f), args.tolerance, args.slack_ms)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
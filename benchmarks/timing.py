@@ -0,0 +1,35 @@
+"""
+Small timing helpers shared by the benchmark scripts
+"""
+
+import statistics
+import time
+
+
+def measure(action, rounds=10, before_each=None):
+    """Run action `rounds` times and return the wall-clock duration of each run in seconds"""
+    samples = []
+    for _ in range(rounds):
+        if before_each:
+            before_each()
+        start = time.perf_counter()
+        action()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def summarize(samples):
+    """Median/mean/min/max of a list of durations, in milliseconds"""
+    return {
+        'rounds': len(samples),
+        'median_ms': statistics.median(samples) * 1000,
+        'mean_ms': statistics.mean(samples) * 1000,
+        'min_ms': min(samples) * 1000,
+        'max_ms': max(samples) * 1000,
+    }
+
+
+def format_summary(name, summary):
+    return (f"{name:<40} median {summary['median_ms']:8.1f} ms  "
+            f"mean {summary['mean_ms']:8.1f} ms  min {summary['min_ms']:8.1f} ms  "
+            f"({summary['rounds']} rounds)")
@@ -4,69 +4,280 @@ try:
     HAS_ALLURE = True
 except Exception:
     HAS_ALLURE = False
+import json
 import os
 from datetime import datetime
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 import sys
 
+from selenium.common.exceptions import WebDriverException
+
 # Add the project root directory to Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from test_data.test_data import TestData
+from utilities.driver_factory import create_driver
+from utilities.driver_pool import DriverPool
+from utilities.element_registry import registry_report
+from utilities.failure_artifacts import ArtifactPipeline
+from utilities.instrumentation import (TimingCollector, instrument_driver, start_timeline,
+                                       stop_timeline, safe_file_name, write_json)
+from utilities.preconditions import BILL_PAY_SETUP, PreconditionHealth
+from utilities.session_state import SessionStateStore
+from utilities.settings import (get_settings, configure as configure_settings,
+                                reset as reset_settings, watch as watch_settings)
+from utilities.stub_server import StubServer
+from utilities.user_pool import UserPool
+from utilities.user_provisioning import UserProvisioner
+from utilities.wait_policy import wait_report
+
+# Duration-aware ordering, xdist grouping and --shard; --lint-selectors
+pytest_plugins = ["utilities.scheduler", "utilities.selector_lint"]
+
 
 def pytest_addoption(parser):
     parser.addoption("--browser", action="store", default="chrome", 
                      help="Type of browser: chrome or firefox")
+    parser.addoption("--browser-profile", action="store", default=None,
+                     choices=["fast", "debug", "visual"],
+                     help="Browser profile; defaults to [browser] profile in config.ini")
+    parser.addoption("--max-driver-uses", action="store", type=int, default=50,
+                     help="Recycle a pooled browser after this many tests")
+    parser.addoption("--target", action="store", default="remote", choices=["local", "remote"],
+                     help="remote: base_url from config.ini, local: bundled ParaBank stub server")
+    parser.addoption("--stub-delay", action="store", type=int, default=None,
+                     help="Response delay of the local stub server in milliseconds")
+    parser.addoption("--step-timings", action="store_true", default=False,
+                     help="Record per-test step timelines and a latency summary in reports/timings")
+    parser.addoption("--base-url", action="store", default=None,
+                     help="Override [application] base_url (also PARABANK_BASE_URL)")
+    parser.addoption("--timeout", action="store", type=int, default=None,
+                     help="Override [application] timeout in seconds (also PARABANK_TIMEOUT)")
+    parser.addoption("--user-pool-size", action="store", type=int, default=None,
+                     help="Override [user_pool] min_size (also PARABANK_USER_POOL_MIN_SIZE)")
+    parser.addoption("--verify-mode", action="store", default="browser", choices=["browser", "http"],
+                     help="http: submit the bill-pay validation matrix over HTTP instead of the browser "
+                          "(--target=local only)")
+    parser.addoption("--config-watch", action="store_true", default=False,
+                     help="Re-read config.ini whenever it changes during the run")
 
 
-@pytest.fixture(scope="class")
-def setup(request):
-    """Main setup fixture with Allure support"""
+TIMINGS_DIR = os.path.join("reports", "timings")
+
+
+def is_xdist_worker(config):
+    """True inside a pytest-xdist worker process"""
+    return hasattr(config, "workerinput")
+
+
+def targets_stub(config):
+    """True when the run uses the throwaway local stub rather than a real ParaBank"""
+    return config.getoption("--target") == "local" and not config.getoption("--base-url")
+
+
+def pytest_configure(config):
+    """Apply command-line settings, share a run id with xdist workers and start the local stub"""
+    config._timing_collector = TimingCollector()
+    
+    # Live ParaBank validates bill-pay input client-side; its billpay.htm does not take form posts
+    if config.getoption("--verify-mode") == "http" and not targets_stub(config):
+        raise pytest.UsageError("--verify-mode=http needs --target=local: live ParaBank "
+                                "only validates bill-pay forms in the browser")
+    
+    if not is_xdist_worker(config):
+        # Workers inherit the controller's environment, so test data stays unique per run
+        os.environ.setdefault("PARABANK_RUN_ID", TestData.RUN_ID)
+    
+    # Command-line values win over PARABANK_* variables and config.ini
+    configure_settings(
+        base_url=config.getoption("--base-url"),
+        timeout=config.getoption("--timeout"),
+        browser_profile=config.getoption("--browser-profile"),
+        user_pool_min_size=config.getoption("--user-pool-size"),
+    )
+    if config.getoption("--config-watch"):
+        watch_settings()
+    
+    if (config.getoption("--target") != "local" or config.getoption("--base-url")
+            or os.environ.get("PARABANK_BASE_URL")):
+        return
+    
+    delay_ms = config.getoption("--stub-delay")
+    if delay_ms is None:
+        delay_ms = get_settings().stub_delay_ms
+    
+    server = StubServer(delay_ms=delay_ms).start()
+    config._stub_server = server
+    configure_settings(base_url=server.base_url)
+    # xdist workers and other child processes pick the stub up from the environment
+    os.environ["PARABANK_BASE_URL"] = server.base_url
+    print(f"ParaBank stub server running at {server.base_url}")
+
+
+def pytest_unconfigure(config):
+    server = getattr(config, "_stub_server", None)
+    if server is not None:
+        server.stop()
+        os.environ.pop("PARABANK_BASE_URL", None)
+    reset_settings()
+
+
+@pytest.fixture(scope="session")
+def driver_pool(request):
+    """Session-wide pool of warm browsers shared by all tests"""
     browser = request.config.getoption("--browser")
+    profile = request.config.getoption("--browser-profile")
+    pool = DriverPool(lambda: instrument_driver(create_driver(browser, profile)),
+                      max_uses=request.config.getoption("--max-driver-uses"))
+    request.config._driver_pool = pool
+    
+    yield pool
+    
+    pool.shutdown()
+
+
+@pytest.fixture(autouse=True)
+def step_timeline(request):
+    """Record a timeline of page-object steps and WebDriver commands for each test"""
+    if not request.config.getoption("--step-timings"):
+        yield
+        return
+    
+    timeline = start_timeline(request.node.nodeid)
+    
+    yield timeline
+    
+    stop_timeline()
+    request.config._timing_collector.add_timeline(timeline)
+    write_json(os.path.join(TIMINGS_DIR, "tests", f"{safe_file_name(timeline.test_id)}.json"),
+               timeline.to_dict())
+
+
+@pytest.fixture
+def pooled_driver(request, driver_pool, artifact_pipeline):
+    """Clean browser from the pool for a single test"""
+    driver = driver_pool.acquire()
+    
+    yield driver
+    
+    # Capture failure artifacts
+    if hasattr(request.node, 'rep_call') and request.node.rep_call.failed:
+        capture_failure_artifacts(artifact_pipeline, driver, request.node.name)
+    
+    # A browser that raised WebDriverException may have crashed or lost its session: don't reuse it
+    driver_pool.release(driver, broken=getattr(request.node, 'driver_error', False))
+
+
+@pytest.fixture(scope="session")
+def artifact_pipeline():
+    """Background pipeline that stores compressed, de-duplicated failure artifacts"""
+    settings = get_settings()
+    pipeline = ArtifactPipeline(
+        os.path.join("reports", "failures"),
+        max_bytes=settings.artifacts_max_mb * 1024 * 1024,
+        image_format=settings.artifacts_image_format,
+        quality=settings.artifacts_quality
+    )
+    
+    yield pipeline
+    
+    pipeline.flush()
+
+
+@pytest.fixture(scope="session")
+def user_provisioner():
+    """HTTP user provisioning with a connection pool shared by the whole session"""
+    provisioner = UserProvisioner()
+    
+    yield provisioner
+    
+    provisioner.close()
+
+
+@pytest.fixture(scope="session")
+def user_pool(request, user_provisioner):
+    """Registered users persisted across runs; None when disabled in config.ini or on the stub"""
+    settings = get_settings()
+    # The stub forgets its users and changes port every run - pooled rows could never be reused
+    if not settings.user_pool_enabled or targets_stub(request.config):
+        yield None
+        return
     
-    if browser == "chrome":
-        driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()))
-    elif browser == "firefox":
-        driver = webdriver.Firefox()
-    else:
-        driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()))
+    pool = UserPool(user_provisioner, min_size=settings.user_pool_min_size,
+                    refill_size=max(settings.user_pool_refill_size, settings.user_pool_min_size))
+    # Pre-seeded users from config.ini join the pool
+    for username, password in settings.seeded_users:
+        pool.add(username, password)
     
-    driver.implicitly_wait(10)
-    driver.maximize_window()
+    yield pool
+    
+    pool.wait_for_refill()
+
+
+@pytest.fixture(scope="session")
+def session_states(request):
+    """Saved logged-in browser sessions; None when disabled in config.ini or on the stub"""
+    settings = get_settings()
+    # Snapshots are keyed by base URL and the stub binds a new port every run - they would only pile up
+    if not settings.session_state_enabled or targets_stub(request.config):
+        return None
+    store = SessionStateStore(max_age=settings.session_state_max_age)
+    request.config._session_states = store
+    return store
+
+
+@pytest.fixture(scope="session")
+def precondition_health(request):
+    """Probe the pages every suite depends on once, before any browser starts"""
+    settings = get_settings()
+    health = PreconditionHealth.probe(settings.base_url, timeout=settings.health_probe_timeout,
+                                      threshold=settings.health_breaker_threshold)
+    request.config._precondition_health = health
+    return health
+
+
+@pytest.fixture
+def registration_preconditions(precondition_health):
+    """Skip registration tests up front when register.htm was down at session start"""
+    precondition_health.require("register.htm")
+    return precondition_health
+
+
+@pytest.fixture
+def bill_pay_preconditions(precondition_health):
+    """Skip bill-pay tests up front when their pages are down or their setup keeps failing"""
+    precondition_health.require("index.htm", "billpay.htm")
+    precondition_health.breaker(BILL_PAY_SETUP).check()
+    return precondition_health
+
+
+@pytest.fixture(scope="class")
+def setup(request, driver_pool, artifact_pipeline):
+    """Main setup fixture with Allure support"""
+    driver = driver_pool.acquire()
     request.cls.driver = driver
     
     yield driver
     
-    # Take screenshot on test failure
+    # Capture failure artifacts
     if hasattr(request.node, 'rep_call') and request.node.rep_call.failed:
-        take_allure_screenshot(driver, request.node.name)
+        capture_failure_artifacts(artifact_pipeline, driver, request.node.name)
     
-    driver.quit()
+    # A browser that raised WebDriverException may have crashed or lost its session: don't reuse it
+    driver_pool.release(driver, broken=getattr(request.node, 'driver_error', False))
 
 
-def take_allure_screenshot(driver, test_name):
-    """Take screenshot and attach to Allure report"""
-    try:
-        # Take screenshot as PNG
-        screenshot = driver.get_screenshot_as_png()
-        # If Allure is available, attach; otherwise save locally
-        if HAS_ALLURE:
-            allure.attach(
-                screenshot,
-                name=f"screenshot_{test_name}",
-                attachment_type=allure.attachment_type.PNG
-            )
-            print(f"Screenshot captured and attached to Allure for failed test: {test_name}")
-        else:
-            # Ensure reports/screenshots exists
-            os.makedirs(os.path.join("reports", "screenshots"), exist_ok=True)
-            file_path = os.path.join("reports", "screenshots", f"screenshot_{test_name}.png")
-            with open(file_path, "wb") as f:
-                f.write(screenshot)
-            print(f"Screenshot saved to {file_path} for failed test: {test_name}")
-    except Exception as e:
-        print(f"Could not capture screenshot: {e}")
+def capture_failure_artifacts(pipeline, driver, test_name):
+    """Capture screenshot, DOM and console log; encoding and disk I/O happen in the background"""
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    screenshot = pipeline.capture(driver, f"{worker}::{test_name}")
+    # Allure attachments must be added while the test is still current
+    if HAS_ALLURE and screenshot:
+        allure.attach(
+            screenshot,
+            name=f"screenshot_{test_name}",
+            attachment_type=allure.attachment_type.PNG
+        )
+    print(f"Failure artifacts queued for {test_name} in {pipeline.output_dir}")
 
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
@@ -80,11 +291,77 @@ def pytest_runtest_makereport(item, call):
     
     # Store test result for later use (screenshots)
     setattr(item, "rep_" + report.when, report)
+    if report.when == "call" and call.excinfo is not None:
+        item.driver_error = call.excinfo.errisinstance(WebDriverException)
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """Report driver pool savings, broken preconditions and where tests waited"""
+    pool = getattr(config, "_driver_pool", None)
+    if pool is not None:
+        terminalreporter.write_line(pool.summary())
+    registry_line = registry_report()
+    if registry_line:
+        terminalreporter.write_line(registry_line)
+    states = getattr(config, "_session_states", None)
+    if states is not None and states.restored + states.captured:
+        terminalreporter.write_line(f"Session state: {states.restored} restored, "
+                                    f"{states.captured} captured after a full login")
+    
+    health = getattr(config, "_precondition_health", None)
+    health_lines = health.report() if health is not None else []
+    if health_lines:
+        terminalreporter.write_sep("-", "precondition health")
+        for line in health_lines:
+            terminalreporter.write_line(line)
+    
+    if config.getoption("--step-timings") and not is_xdist_worker(config):
+        summary = config._timing_collector.summary()
+        if summary:
+            terminalreporter.write_sep("-", "slowest actions (p50 / p95 / p99)")
+            for name, row in list(summary.items())[:15]:
+                terminalreporter.write_line(
+                    f"{name:<45} {row['count']:5d}x  {row['p50_ms']:9.1f} / "
+                    f"{row['p95_ms']:9.1f} / {row['p99_ms']:9.1f} ms")
+            terminalreporter.write_line(f"Full report: {os.path.join(TIMINGS_DIR, 'summary.json')}")
+    
+    wait_lines = wait_report()
+    if wait_lines:
+        terminalreporter.write_sep("-", "time spent waiting per page-object method")
+        for line in wait_lines:
+            terminalreporter.write_line(line)
+
+
+def write_timing_summary(config):
+    """Workers dump raw samples; the controller (or a serial run) merges them into summary.json"""
+    collector = config._timing_collector
+    samples_dir = os.path.join(TIMINGS_DIR, "samples")
+    
+    if is_xdist_worker(config):
+        worker = config.workerinput["workerid"]
+        write_json(os.path.join(samples_dir, f"{worker}.json"), collector.samples)
+        return
+    
+    if os.path.isdir(samples_dir):
+        for file_name in os.listdir(samples_dir):
+            if file_name.endswith(".json"):
+                with open(os.path.join(samples_dir, file_name)) as f:
+                    collector.merge(json.load(f))
+                os.remove(os.path.join(samples_dir, file_name))
+    
+    write_json(os.path.join(TIMINGS_DIR, "summary.json"), collector.summary())
 
 
 # Optional: Add environment info to Allure report
 def pytest_sessionfinish(session, exitstatus):
     """Add environment properties to Allure results"""
+    if session.config.getoption("--step-timings"):
+        write_timing_summary(session.config)
+    
+    # Only the controller writes shared report files in parallel runs
+    if is_xdist_worker(session.config):
+        return
+    
     # Create allure-results directory if it doesn't exist
     os.makedirs("allure-results", exist_ok=True)
     
@@ -99,9 +376,12 @@ def pytest_sessionfinish(session, exitstatus):
     }
     
     try:
-        with open("allure-results/environment.properties", "w") as f:
+        # Write to a temp file and rename, so readers never see a half-written file
+        tmp_path = f"allure-results/environment.properties.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
             for key, value in env_props.items():
                 f.write(f"{key}={value}\n")
+        os.replace(tmp_path, "allure-results/environment.properties")
         print("Environment properties saved for Allure report")
     except Exception as e:
         print(f"Could not save environment properties: {e}")
\ No newline at end of file
@@ -1,10 +1,14 @@
 ﻿from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import Select
+from utilities.base_page import BasePage
+from utilities.outcome import Outcome, detect_outcome, outcome_detected
+from utilities.waits import select_has_options
 
 
-class BillPayPage:
+class BillPayPage(BasePage):
     """Page Object for Bill Pay"""
     
+    ROUTE = "billpay"
+    
     # Complete locators
     PAYEE_NAME = (By.NAME, "payee.name")
     PAYEE_ADDRESS = (By.NAME, "payee.address.street")
@@ -17,32 +21,40 @@ class BillPayPage:
     AMOUNT = (By.NAME, "amount")
     FROM_ACCOUNT = (By.NAME, "fromAccountId")
     SEND_BUTTON = (By.XPATH, "//input[@value='Send Payment']")
+    RESULT_PANEL = (By.ID, "billpayResult")
+    ERROR_MESSAGE = (By.CSS_SELECTOR, "span.error")
+    SUCCESS_SELECTOR = "#billpayResult"
+    # Hidden once a payment went through, so a result page still counts as "not on the form"
+    READY_LOCATOR = AMOUNT
     
     def __init__(self, driver):
-        self.driver = driver
+        super().__init__(driver)
+    
+    def wait_until_ready(self):
+        """Wait until the form and its account dropdown have been populated"""
+        self.wait_for_page_ready()
+        self.wait.until(select_has_options(self.FROM_ACCOUNT))
+        return self
     
     # METHOD 1: fill_form (new name)
-    def fill_form(self, bill_data):
+    def fill_form(self, bill_data, keystroke_fields=()):
         """Fill form with provided data"""
-        # Fill all fields
-        self.driver.find_element(*self.PAYEE_NAME).send_keys(bill_data.get('payee_name', ''))
-        self.driver.find_element(*self.PAYEE_ADDRESS).send_keys(bill_data.get('payee_address', ''))
-        self.driver.find_element(*self.PAYEE_CITY).send_keys(bill_data.get('payee_city', ''))
-        self.driver.find_element(*self.PAYEE_STATE).send_keys(bill_data.get('payee_state', ''))
-        self.driver.find_element(*self.PAYEE_ZIP_CODE).send_keys(bill_data.get('payee_zip', ''))
-        self.driver.find_element(*self.PAYEE_PHONE).send_keys(bill_data.get('payee_phone', ''))
-        self.driver.find_element(*self.PAYEE_ACCOUNT).send_keys(bill_data.get('payee_account', ''))
-        
         # Verify account (use same as payee_account if not provided)
         verify_account = bill_data.get('verify_account', bill_data.get('payee_account', ''))
-        self.driver.find_element(*self.VERIFY_ACCOUNT).send_keys(verify_account)
         
-        self.driver.find_element(*self.AMOUNT).send_keys(bill_data.get('amount', ''))
-        
-        # Select from account
-        dropdown = Select(self.driver.find_element(*self.FROM_ACCOUNT))
-        if dropdown.options:
-            dropdown.select_by_index(0)
+        # Fill all fields in one round-trip; None selects the first from account
+        self.fill_fields({
+            self.PAYEE_NAME: bill_data.get('payee_name', ''),
+            self.PAYEE_ADDRESS: bill_data.get('payee_address', ''),
+            self.PAYEE_CITY: bill_data.get('payee_city', ''),
+            self.PAYEE_STATE: bill_data.get('payee_state', ''),
+            self.PAYEE_ZIP_CODE: bill_data.get('payee_zip', ''),
+            self.PAYEE_PHONE: bill_data.get('payee_phone', ''),
+            self.PAYEE_ACCOUNT: bill_data.get('payee_account', ''),
+            self.VERIFY_ACCOUNT: verify_account,
+            self.AMOUNT: bill_data.get('amount', ''),
+            self.FROM_ACCOUNT: None,
+        }, keystroke_fields=keystroke_fields)
         
         return self
     
@@ -72,26 +84,38 @@ class BillPayPage:
         }
     
     def submit(self):
-        """Submit the form"""
-        self.driver.find_element(*self.SEND_BUTTON).click()
+        """Submit the form and wait for a result or a validation message
+
+        Raises TimeoutException when neither shows up, instead of letting the
+        caller assert on a half-loaded page.
+        """
+        self.click(self.SEND_BUTTON)
+        # The post replaces the document; handles from the form page are gone
+        self.elements.clear()
+        self.wait.until(outcome_detected(success_selector=self.SUCCESS_SELECTOR),
+                        message="Bill payment showed neither a result nor a validation message")
         return self
     
+    def get_outcome(self):
+        """Classify the submission result from the visible result markers"""
+        return detect_outcome(self.driver, success_selector=self.SUCCESS_SELECTOR)
+    
     def is_successful(self):
         """Check if payment was successful"""
-        return "Bill Payment Complete" in self.driver.page_source
+        return self.get_outcome().outcome == Outcome.SUCCESS
     
     def has_errors(self):
         """Check if there are errors"""
-        page_text = self.driver.page_source.lower()
-        return "error" in page_text or "required" in page_text
+        return self.get_outcome().outcome in (Outcome.VALIDATION_ERROR, Outcome.SERVER_ERROR)
     
     def clear_amount(self):
         """Clear the amount field"""
-        self.driver.find_element(*self.AMOUNT).clear()
+        self.with_element(self.AMOUNT, lambda element: element.clear())
         return self
     
     def set_amount(self, amount):
         """Set amount field to specific value"""
+        # Second lookup is a registry hit - one findElement for both actions
         self.clear_amount()
-        self.driver.find_element(*self.AMOUNT).send_keys(amount)
+        self.send_keys(self.AMOUNT, amount)
         return self
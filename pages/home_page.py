@@ -1,29 +1,29 @@
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from utilities.base_page import BasePage
 
 
-class HomePage:
+class HomePage(BasePage):
+    ROUTE = "home"
+    READY_LOCATOR = (By.NAME, "username")
+    
     REGISTER_LINK = (By.LINK_TEXT, "Register")
     USERNAME_FIELD = (By.NAME, "username")
     PASSWORD_FIELD = (By.NAME, "password")
     LOGIN_BUTTON = (By.XPATH, "//input[@value='Log In']")
     
     def __init__(self, driver):
-        self.driver = driver
-        self.wait = WebDriverWait(driver, 10)
-        self.driver.get("https://parabank.parasoft.com/parabank")
-    
-    def click(self, by_locator):
-        self.wait.until(EC.element_to_be_clickable(by_locator)).click()
-    
-    def send_keys(self, by_locator, text):
-        self.wait.until(EC.visibility_of_element_located(by_locator)).send_keys(text)
+        # No load here - use Router(driver).open(HomePage) to navigate
+        super().__init__(driver)
     
     def navigate_to_register_page(self):
         self.click(self.REGISTER_LINK)
+        self.wait_for_url_contains("register.htm")
+        self.wait_for_page_ready()
     
     def login(self, username, password):
+        current_url = self.driver.current_url
         self.send_keys(self.USERNAME_FIELD, username)
         self.send_keys(self.PASSWORD_FIELD, password)
-        self.click(self.LOGIN_BUTTON)
\ No newline at end of file
+        self.click(self.LOGIN_BUTTON)
+        self.wait_for_url_change(current_url)
+        self.wait_for_page_ready()
@@ -24,18 +24,13 @@ if (-not (Test-Path "screenshots")) {
     Write-Host "Created screenshots directory" -ForegroundColor Gray
 }
 
-# Run Registration Tests with Allure
-Write-Host "`n[1/2] Running Registration Tests..." -ForegroundColor Green
-pytest tests/test_registration.py `
-    -v `
-    --tb=short `
-    --alluredir=allure-results
-
-# Run Bill Pay Tests with Allure
-Write-Host "`n[2/2] Running Bill Pay Tests..." -ForegroundColor Green
-pytest tests/test_bill_pay.py `
+# Run all suites in one session: smoke tests first, workers balanced by recorded durations
+Write-Host "`nRunning Registration and Bill Pay Tests..." -ForegroundColor Green
+pytest tests/test_registration.py tests/test_bill_pay.py `
     -v `
     --tb=short `
+    -n auto `
+    --dist loadgroup `
     --alluredir=allure-results
 
 # Generate Allure Report
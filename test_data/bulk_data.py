@@ -0,0 +1,125 @@
+"""
+Batch generation of user and bill-pay records
+
+Draws every random column for a chunk of records at once (NumPy when it is
+installed, the random module otherwise) and derives usernames, SSNs and
+account numbers from the record index, so they are unique across the whole
+stream without remembering what was generated. The same seed always
+produces the same records (zip codes and phone numbers differ between the
+NumPy and pure-Python backends; usernames, SSNs and accounts do not).
+"""
+
+import math
+import random
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except Exception:
+    HAS_NUMPY = False
+
+NINE_DIGITS = 10 ** 9
+
+
+class BulkDataGenerator:
+    """Generates N records at once, or streams them chunk by chunk"""
+
+    def __init__(self, seed=None, namespace=None, chunk_size=1000):
+        self.seed = seed if seed is not None else random.randrange(2 ** 32)
+        self.namespace = namespace or f"s{self.seed:x}"
+        self.chunk_size = chunk_size
+
+        # Independent affine permutations of 0..10^9-1: index i -> (a*i + b) mod 10^9.
+        # a is coprime with 10^9, so distinct indexes always give distinct numbers.
+        setup = random.Random(self.seed)
+        self._ssn_perm = self._permutation(setup)
+        self._account_perm = self._permutation(setup)
+
+    @staticmethod
+    def _permutation(rng):
+        while True:
+            a = rng.randrange(1, NINE_DIGITS)
+            if math.gcd(a, NINE_DIGITS) == 1:
+                return a, rng.randrange(NINE_DIGITS)
+
+    # ============ PUBLIC API ============
+
+    def users(self, count):
+        """List of `count` user records (same keys as TestData.get_valid_user_data)"""
+        return list(self.iter_users(count))
+
+    def bill_payments(self, count):
+        """List of `count` bill-pay records (same keys as TestData.get_valid_bill_pay_data)"""
+        return list(self.iter_bill_payments(count))
+
+    def iter_users(self, count, start=0):
+        """Stream user records without holding all of them in memory"""
+        for offset, size in self._chunks(count, start):
+            zips, phones = self._draw(offset, size, salt=1)
+            ssns = self._permute(self._ssn_perm, offset, size)
+            for i in range(size):
+                yield {
+                    'first_name': 'John',
+                    'last_name': 'Doe',
+                    'address': '123 Main St',
+                    'city': 'New York',
+                    'state': 'NY',
+                    'zip_code': str(zips[i]),
+                    'phone': self._phone(phones[i]),
+                    'ssn': f"{ssns[i]:09d}",
+                    'username': f"user_{self.namespace}_{offset + i}",
+                    'password': 'password123'
+                }
+
+    def iter_bill_payments(self, count, start=0):
+        """Stream bill-pay records without holding all of them in memory"""
+        for offset, size in self._chunks(count, start):
+            zips, phones = self._draw(offset, size, salt=2)
+            accounts = self._permute(self._account_perm, offset, size)
+            for i in range(size):
+                account = f"{accounts[i]:09d}"
+                yield {
+                    'payee_name': 'Test Payee',
+                    'payee_address': '123 Payment St',
+                    'payee_city': 'Payment City',
+                    'payee_state': 'CA',
+                    'payee_zip': str(zips[i]),
+                    'payee_phone': self._phone(phones[i]),
+                    'payee_account': account,
+                    'verify_account': account,
+                    'amount': '100.50'
+                }
+
+    # ============ VECTORIZED DRAWS ============
+
+    def _chunks(self, count, start):
+        for offset in range(start, start + count, self.chunk_size):
+            yield offset, min(self.chunk_size, start + count - offset)
+
+    def _draw(self, offset, size, salt):
+        """Zip codes and phone numbers for one chunk; seeded by chunk so any chunk is reproducible"""
+        chunk_seed = (self.seed, salt, offset)
+        if HAS_NUMPY:
+            rng = np.random.default_rng(list(chunk_seed))
+            zips = rng.integers(10000, 100000, size=size).tolist()
+            phones = rng.integers(0, 900 * 900 * 9000, size=size).tolist()
+        else:
+            rng = random.Random(hash(chunk_seed))
+            zips = [rng.randrange(10000, 100000) for _ in range(size)]
+            phones = [rng.randrange(900 * 900 * 9000) for _ in range(size)]
+        return zips, phones
+
+    @staticmethod
+    def _permute(permutation, offset, size):
+        a, b = permutation
+        if HAS_NUMPY:
+            indexes = np.arange(offset, offset + size, dtype=np.int64)
+            return ((indexes * a + b) % NINE_DIGITS).tolist()
+        return [(i * a + b) % NINE_DIGITS for i in range(offset, offset + size)]
+
+    @staticmethod
+    def _phone(value):
+        """Split one draw into the three phone number groups (100-999, 100-999, 1000-9999)"""
+        value, last = divmod(value, 9000)
+        first, middle = divmod(value, 900)
+        return f"{first + 100}-{middle + 100}-{last + 1000}"
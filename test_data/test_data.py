@@ -1,10 +1,39 @@
+import itertools
+import os
 import random
 import string
 import time
 
+from test_data.bulk_data import BulkDataGenerator
+
+# Leading digits of unique_digits: each xdist worker owns its own numeric range (10-99, no leading zero)
+WORKER_DIGITS = 2
+
+
+def _new_run_id():
+    """Short token that differs between runs: base36 seconds plus two random letters"""
+    seconds = int(time.time()) % (36 ** 5)
+    digits = string.digits + string.ascii_lowercase
+    token = ''
+    for _ in range(5):
+        seconds, remainder = divmod(seconds, 36)
+        token = digits[remainder] + token
+    return token + ''.join(random.choices(string.ascii_lowercase, k=2))
+
+
+def _worker_index():
+    """Numeric pytest-xdist worker index (gw3 -> 3), 0 when not running in parallel"""
+    worker = os.environ.get('PYTEST_XDIST_WORKER', 'gw0')
+    return int(worker[2:]) if worker[2:].isdigit() else 0
+
 
 class TestData:
     
+    # Shared by all xdist workers of a run - conftest exports PARABANK_RUN_ID
+    RUN_ID = os.environ.get('PARABANK_RUN_ID') or _new_run_id()
+    WORKER_INDEX = _worker_index()
+    _sequence = itertools.count(1)
+    
     @staticmethod
     def get_timestamp():
         """Get current timestamp for uniqueness"""
@@ -13,14 +42,36 @@ class TestData:
     @staticmethod
     def generate_random_digits(length=9):
         """Generate random digits of given length"""
-        digits = string.digits
-        return ''.join(random.choice(digits) for _ in range(length))
+        return f"{random.randrange(10 ** length):0{length}d}"
+    
+    @staticmethod
+    def next_sequence():
+        """Next value of this worker's sequence, unique within the run"""
+        return next(TestData._sequence)
+    
+    @staticmethod
+    def unique_username():
+        """Run token + worker + sequence, so parallel workers never collide"""
+        return f"user_{TestData.RUN_ID}w{TestData.WORKER_INDEX}n{TestData.next_sequence()}"
+    
+    @staticmethod
+    def unique_digits(length=9):
+        """Digit string from this worker's range, then its sequence (e.g. SSNs, account numbers)
+
+        The run id only goes into usernames; at 9 digits each worker has
+        9,999,999 values and running out raises instead of wrapping around.
+        """
+        seq_width = length - WORKER_DIGITS
+        if seq_width < 1:
+            raise ValueError(f"unique_digits needs at least {WORKER_DIGITS + 1} digits, got {length}")
+        sequence = TestData.next_sequence()
+        if sequence >= 10 ** seq_width:
+            raise RuntimeError(f"unique_digits({length}) exhausted after {10 ** seq_width - 1} values on this worker")
+        worker_range = 10 ** (WORKER_DIGITS - 1) + TestData.WORKER_INDEX % (9 * 10 ** (WORKER_DIGITS - 1))
+        return f"{worker_range}{sequence:0{seq_width}d}"
     
     @staticmethod
     def get_valid_user_data():
-        timestamp = TestData.get_timestamp()[-6:]
-        random_id = ''.join(random.choices(string.ascii_lowercase, k=4))
-        
         return {
             'first_name': 'John',
             'last_name': 'Doe',
@@ -29,8 +80,8 @@ class TestData:
             'state': 'NY',
             'zip_code': f"{random.randint(10000, 99999)}",
             'phone': f"{random.randint(100, 999)}-{random.randint(100, 999)}-{random.randint(1000, 9999)}",
-            'ssn': TestData.generate_random_digits(9),
-            'username': f'user_{random_id}{timestamp}',
+            'ssn': TestData.unique_digits(9),
+            'username': TestData.unique_username(),
             'password': 'password123'
         }
     
@@ -38,7 +89,6 @@ class TestData:
     @staticmethod
     def get_valid_bill_pay_data():
         """Get valid bill payment data"""
-        print(f"[TestData] Generating bill pay data at {time.time()}")
         return {
             'payee_name': 'Test Payee',
             'payee_address': '123 Payment St',
@@ -46,7 +96,27 @@ class TestData:
             'payee_state': 'CA',
             'payee_zip': f"{random.randint(10000, 99999)}",
             'payee_phone': f"{random.randint(100, 999)}-{random.randint(100, 999)}-{random.randint(1000, 9999)}",
-            'payee_account': TestData.generate_random_digits(9),
+            'payee_account': TestData.unique_digits(9),
             'verify_account': '',  # Will be set in test
             'amount': '100.50'
-        }
\ No newline at end of file
+        }
+    
+    @staticmethod
+    def generate_users(count, seed=None):
+        """Batch of unique user records; the same seed gives the same records"""
+        return BulkDataGenerator(seed).users(count)
+    
+    @staticmethod
+    def generate_bill_pay_data(count, seed=None):
+        """Batch of unique bill-pay records; the same seed gives the same records"""
+        return BulkDataGenerator(seed).bill_payments(count)
+    
+    @staticmethod
+    def iter_users(count, seed=None, chunk_size=1000):
+        """Stream user records chunk by chunk for huge data-driven runs"""
+        return BulkDataGenerator(seed, chunk_size=chunk_size).iter_users(count)
+    
+    @staticmethod
+    def iter_bill_pay_data(count, seed=None, chunk_size=1000):
+        """Stream bill-pay records chunk by chunk for huge data-driven runs"""
+        return BulkDataGenerator(seed, chunk_size=chunk_size).iter_bill_payments(count)
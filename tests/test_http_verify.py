@@ -0,0 +1,82 @@
+"""
+HTTP VERIFICATION - OUTCOME PARSER UNIT TESTS (no browser)
+"""
+
+import sys
+import os
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utilities.http_verify import BILL_PAY_SUCCESS_ID, parse_outcome
+from utilities.outcome import Outcome
+
+
+def page(content):
+    """A ParaBank page with content in the right-hand panel"""
+    return f"""<html><body>
+    <div id="leftPanel"><h2>Account Services</h2></div>
+    <div id="rightPanel">{content}</div>
+    </body></html>"""
+
+
+SUCCESS_PANEL = f"""
+<div id="{BILL_PAY_SUCCESS_ID}">
+    <h1 class="title">Bill Payment Complete</h1>
+    <p>Bill Payment to Test Payee in the amount of $100.50 was successful.</p>
+</div>"""
+
+
+class TestParseOutcome:
+
+    def test_visible_error_is_validation_error(self):
+        outcome = parse_outcome(page('<span class="error">Please enter a valid amount.</span>'),
+                                success_id=BILL_PAY_SUCCESS_ID)
+
+        assert outcome.outcome == Outcome.VALIDATION_ERROR
+        assert outcome.message == "Please enter a valid amount."
+
+    def test_success_panel(self):
+        outcome = parse_outcome(page(SUCCESS_PANEL), success_id=BILL_PAY_SUCCESS_ID)
+
+        assert outcome.outcome == Outcome.SUCCESS
+        assert outcome.message == "Bill Payment Complete"
+
+    @pytest.mark.parametrize("span_attrs", [
+        'class="error" style="display: none"',
+        'class="error ng-hide"',
+        'class="error" hidden',
+    ])
+    def test_hidden_error_spans_are_ignored(self, span_attrs):
+        """Error templates the page keeps hidden are not part of the reported validation message"""
+        markup = page(f'<span {span_attrs}>Payee name is required.</span>'
+                      '<span class="error">Please enter a valid amount.</span>')
+
+        outcome = parse_outcome(markup, success_id=BILL_PAY_SUCCESS_ID)
+
+        assert outcome.outcome == Outcome.VALIDATION_ERROR
+        assert outcome.message == "Please enter a valid amount."
+
+    @pytest.mark.parametrize("hidden_attrs", [
+        'style="DISPLAY:NONE;"',
+        'class="form ng-hide"',
+        'hidden="hidden"',
+    ])
+    def test_errors_inside_hidden_container_are_ignored(self, hidden_attrs):
+        markup = page(f'<div {hidden_attrs}><p><span class="error">Amount is required.</span></p></div>')
+
+        outcome = parse_outcome(markup, success_id=BILL_PAY_SUCCESS_ID)
+
+        assert outcome.outcome == Outcome.UNKNOWN, outcome.message
+
+    def test_hidden_success_panel_is_ignored(self):
+        """A hidden result panel next to a visible error is a validation error"""
+        markup = page(f'<div style="display:none">{SUCCESS_PANEL}</div>'
+                      '<span class="error">The account numbers do not match.</span>')
+
+        outcome = parse_outcome(markup, success_id=BILL_PAY_SUCCESS_ID)
+
+        assert outcome.outcome == Outcome.VALIDATION_ERROR
+        assert outcome.message == "The account numbers do not match."
@@ -3,53 +3,41 @@ PARABANK REGISTRATION TESTS - FIXED VERSION
 """
 
 import pytest
-import time
 import sys
 import os
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-
 from pages.register_page import RegisterPage
 from test_data.test_data import TestData
-from utilities.config_reader import ConfigReader
+from utilities.data_source import parametrize_from
+from utilities.settings import get_settings
 
 
 @pytest.fixture
-def setup():
+def setup(registration_preconditions, pooled_driver):
     """Setup fixture for registration tests"""
-    config = ConfigReader()
-    base_url = config.get_base_url()
-    
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()))
-    driver.implicitly_wait(5)
-    driver.maximize_window()
+    base_url = get_settings().base_url
     
-    yield driver, base_url
-    
-    driver.quit()
+    yield pooled_driver, base_url
 
 
 class TestParaBankRegistration:
     
     # ============ POSITIVE TEST CASES ============
     
+    @pytest.mark.smoke
     def test_1_valid_registration(self, setup):
         """Test 1: Valid registration with all required fields should succeed"""
         driver, base_url = setup
         
         driver.get(f"{base_url}/register.htm")
-        time.sleep(1)
         
         register_page = RegisterPage(driver)
         user_data = TestData.get_valid_user_data()
         
         register_page.register_user(user_data)
-        time.sleep(2)
         
         # EXPECTED: Registration should SUCCEED
         assert register_page.is_registration_successful(), \
@@ -59,204 +47,39 @@ class TestParaBankRegistration:
     # ParaBank is a DEMO application and doesn't have proper validation
     # These tests document the actual behavior rather than asserting expected behavior
     
-    def test_2_missing_first_name(self, setup):
-        """Test 2: ParaBank accepts registration without first name (DEMO APP BEHAVIOR)"""
+    @parametrize_from("test_data/registration_missing_fields.csv")
+    def test_missing_required_field(self, setup, field, label):
+        """Tests 2-10: ParaBank accepts registration with a blank required field (DEMO APP BEHAVIOR)"""
         driver, base_url = setup
         
         driver.get(f"{base_url}/register.htm")
-        time.sleep(1)
         
         register_page = RegisterPage(driver)
         user_data = TestData.get_valid_user_data()
-        user_data['first_name'] = ""
+        user_data[field] = ""
         
         register_page.register_user(user_data)
-        time.sleep(2)
         
-        # ParaBank DEMO behavior: Accepts empty first name
+        # ParaBank DEMO behavior: Accepts the empty field
         # We document this behavior rather than fail the test
         if register_page.is_registration_successful():
-            print("INFO: ParaBank (demo app) accepts registration without first name")
-            # Don't fail - this is expected demo app behavior
+            print(f"INFO: ParaBank (demo app) accepts registration without {label}")
             assert True
         else:
             # If it actually fails, that's good validation
             assert not register_page.is_registration_successful(), \
-                "Missing first name should fail"
-    
-    def test_3_missing_last_name(self, setup):
-        """Test 3: ParaBank accepts registration without last name (DEMO APP BEHAVIOR)"""
-        driver, base_url = setup
-        
-        driver.get(f"{base_url}/register.htm")
-        time.sleep(1)
-        
-        register_page = RegisterPage(driver)
-        user_data = TestData.get_valid_user_data()
-        user_data['last_name'] = ""
-        
-        register_page.register_user(user_data)
-        time.sleep(2)
-        
-        # ParaBank DEMO behavior: Accepts empty last name
-        if register_page.is_registration_successful():
-            print("INFO: ParaBank (demo app) accepts registration without last name")
-            assert True  # Document behavior
-        else:
-            assert not register_page.is_registration_successful()
-    
-    def test_4_missing_address(self, setup):
-        """Test 4: ParaBank accepts registration without address (DEMO APP BEHAVIOR)"""
-        driver, base_url = setup
-        
-        driver.get(f"{base_url}/register.htm")
-        time.sleep(1)
-        
-        register_page = RegisterPage(driver)
-        user_data = TestData.get_valid_user_data()
-        user_data['address'] = ""
-        
-        register_page.register_user(user_data)
-        time.sleep(2)
-        
-        if register_page.is_registration_successful():
-            print("INFO: ParaBank (demo app) accepts registration without address")
-            assert True
-        else:
-            assert not register_page.is_registration_successful()
-    
-    def test_5_missing_city(self, setup):
-        """Test 5: ParaBank accepts registration without city (DEMO APP BEHAVIOR)"""
-        driver, base_url = setup
-        
-        driver.get(f"{base_url}/register.htm")
-        time.sleep(1)
-        
-        register_page = RegisterPage(driver)
-        user_data = TestData.get_valid_user_data()
-        user_data['city'] = ""
-        
-        register_page.register_user(user_data)
-        time.sleep(2)
-        
-        if register_page.is_registration_successful():
-            print("INFO: ParaBank (demo app) accepts registration without city")
-            assert True
-        else:
-            assert not register_page.is_registration_successful()
-    
-    def test_6_missing_zip_code(self, setup):
-        """Test 6: ParaBank accepts registration without zip code (DEMO APP BEHAVIOR)"""
-        driver, base_url = setup
-        
-        driver.get(f"{base_url}/register.htm")
-        time.sleep(1)
-        
-        register_page = RegisterPage(driver)
-        user_data = TestData.get_valid_user_data()
-        user_data['zip_code'] = ""
-        
-        register_page.register_user(user_data)
-        time.sleep(2)
-        
-        if register_page.is_registration_successful():
-            print("INFO: ParaBank (demo app) accepts registration without zip code")
-            assert True
-        else:
-            assert not register_page.is_registration_successful()
-    
-    def test_7_missing_phone(self, setup):
-        """Test 7: ParaBank accepts registration without phone (DEMO APP BEHAVIOR)"""
-        driver, base_url = setup
-        
-        driver.get(f"{base_url}/register.htm")
-        time.sleep(1)
-        
-        register_page = RegisterPage(driver)
-        user_data = TestData.get_valid_user_data()
-        user_data['phone'] = ""
-        
-        register_page.register_user(user_data)
-        time.sleep(2)
-        
-        if register_page.is_registration_successful():
-            print("INFO: ParaBank (demo app) accepts registration without phone")
-            assert True
-        else:
-            assert not register_page.is_registration_successful()
-    
-    def test_8_missing_ssn(self, setup):
-        """Test 8: ParaBank accepts registration without SSN (DEMO APP BEHAVIOR)"""
-        driver, base_url = setup
-        
-        driver.get(f"{base_url}/register.htm")
-        time.sleep(1)
-        
-        register_page = RegisterPage(driver)
-        user_data = TestData.get_valid_user_data()
-        user_data['ssn'] = ""
-        
-        register_page.register_user(user_data)
-        time.sleep(2)
-        
-        if register_page.is_registration_successful():
-            print("INFO: ParaBank (demo app) accepts registration without SSN")
-            assert True
-        else:
-            assert not register_page.is_registration_successful()
-    
-    def test_9_missing_username(self, setup):
-        """Test 9: ParaBank accepts registration without username (DEMO APP BEHAVIOR)"""
-        driver, base_url = setup
-        
-        driver.get(f"{base_url}/register.htm")
-        time.sleep(1)
-        
-        register_page = RegisterPage(driver)
-        user_data = TestData.get_valid_user_data()
-        user_data['username'] = ""
-        
-        register_page.register_user(user_data)
-        time.sleep(2)
-        
-        if register_page.is_registration_successful():
-            print("INFO: ParaBank (demo app) accepts registration without username")
-            assert True
-        else:
-            assert not register_page.is_registration_successful()
-    
-    def test_10_missing_password(self, setup):
-        """Test 10: ParaBank accepts registration without password (DEMO APP BEHAVIOR)"""
-        driver, base_url = setup
-        
-        driver.get(f"{base_url}/register.htm")
-        time.sleep(1)
-        
-        register_page = RegisterPage(driver)
-        user_data = TestData.get_valid_user_data()
-        user_data['password'] = ""
-        
-        register_page.register_user(user_data)
-        time.sleep(2)
-        
-        if register_page.is_registration_successful():
-            print("INFO: ParaBank (demo app) accepts registration without password")
-            assert True
-        else:
-            assert not register_page.is_registration_successful()
+                f"Missing {label} should fail"
     
     def test_11_password_mismatch(self, setup):
         """Test 11: ParaBank accepts registration with mismatched passwords (DEMO APP BEHAVIOR)"""
         driver, base_url = setup
         
         driver.get(f"{base_url}/register.htm")
-        time.sleep(1)
         
         register_page = RegisterPage(driver)
         user_data = TestData.get_valid_user_data()
         
         register_page.register_user(user_data, confirm_password="DifferentPassword123")
-        time.sleep(2)
         
         if register_page.is_registration_successful():
             print("INFO: ParaBank (demo app) accepts registration with mismatched passwords")
@@ -270,33 +93,28 @@ class TestParaBankRegistration:
         
         # First registration
         driver.get(f"{base_url}/register.htm")
-        time.sleep(1)
         
         register_page1 = RegisterPage(driver)
         user_data1 = TestData.get_valid_user_data()
         username = user_data1['username']
         
         register_page1.register_user(user_data1)
-        time.sleep(2)
         
         # Logout if successful
         if register_page1.is_registration_successful():
             try:
                 driver.find_element_by_link_text("Log Out").click()
-                time.sleep(1)
             except:
                 pass
         
         # Second registration with same username
         driver.get(f"{base_url}/register.htm")
-        time.sleep(1)
         
         register_page2 = RegisterPage(driver)
         user_data2 = TestData.get_valid_user_data()
         user_data2['username'] = username
         
         register_page2.register_user(user_data2)
-        time.sleep(2)
         
         if register_page2.is_registration_successful():
             print(f"INFO: ParaBank (demo app) accepts duplicate username '{username}'")
@@ -309,7 +127,6 @@ class TestParaBankRegistration:
         driver, base_url = setup
         
         driver.get(f"{base_url}/register.htm")
-        time.sleep(1)
         
         register_page = RegisterPage(driver)
         empty_data = {
@@ -319,7 +136,6 @@ class TestParaBankRegistration:
         }
         
         register_page.register_user(empty_data)
-        time.sleep(2)
         
         if register_page.is_registration_successful():
             print("INFO: ParaBank (demo app) accepts registration with all empty fields")
@@ -332,14 +148,12 @@ class TestParaBankRegistration:
         driver, base_url = setup
         
         driver.get(f"{base_url}/register.htm")
-        time.sleep(1)
         
         register_page = RegisterPage(driver)
         user_data = TestData.get_valid_user_data()
         user_data['ssn'] = "abc-12-3456"
         
         register_page.register_user(user_data)
-        time.sleep(2)
         
         # ParaBank might accept invalid SSN format
         if register_page.is_registration_successful():
@@ -352,14 +166,12 @@ class TestParaBankRegistration:
         driver, base_url = setup
         
         driver.get(f"{base_url}/register.htm")
-        time.sleep(1)
         
         register_page = RegisterPage(driver)
         user_data = TestData.get_valid_user_data()
         user_data['password'] = "123"
         
         register_page.register_user(user_data)
-        time.sleep(2)
         
         if register_page.is_registration_successful():
             pytest.xfail("ParaBank accepts very short passwords - security concern in demo app")
@@ -371,14 +183,12 @@ class TestParaBankRegistration:
         driver, base_url = setup
         
         driver.get(f"{base_url}/register.htm")
-        time.sleep(1)
         
         register_page = RegisterPage(driver)
         user_data = TestData.get_valid_user_data()
         user_data['username'] = "User@#$%"
         
         register_page.register_user(user_data)
-        time.sleep(2)
         
         if register_page.is_registration_successful():
             print("INFO: ParaBank (demo app) accepts special characters in username")
@@ -391,7 +201,6 @@ class TestParaBankRegistration:
         driver, base_url = setup
         
         driver.get(f"{base_url}/register.htm")
-        time.sleep(1)
         
         register_page = RegisterPage(driver)
         user_data = TestData.get_valid_user_data()
@@ -399,7 +208,6 @@ class TestParaBankRegistration:
         user_data['last_name'] = "67890"
         
         register_page.register_user(user_data)
-        time.sleep(2)
         
         if register_page.is_registration_successful():
             print("INFO: ParaBank (demo app) accepts numeric names")
@@ -412,14 +220,12 @@ class TestParaBankRegistration:
         driver, base_url = setup
         
         driver.get(f"{base_url}/register.htm")
-        time.sleep(1)
         
         register_page = RegisterPage(driver)
         user_data = TestData.get_valid_user_data()
         user_data['address'] = "A" * 200
         
         register_page.register_user(user_data)
-        time.sleep(2)
         
         if register_page.is_registration_successful():
             print("INFO: ParaBank accepts very long address inputs")
@@ -432,7 +238,6 @@ class TestParaBankRegistration:
         driver, base_url = setup
         
         driver.get(f"{base_url}/register.htm")
-        time.sleep(1)
         
         register_page = RegisterPage(driver)
         user_data = TestData.get_valid_user_data()
@@ -440,7 +245,6 @@ class TestParaBankRegistration:
         user_data['last_name'] = "  Doe  "
         
         register_page.register_user(user_data)
-        time.sleep(2)
         
         # Should probably trim spaces, but if it accepts it, that's fine for demo
         if register_page.is_registration_successful():
@@ -454,14 +258,12 @@ class TestParaBankRegistration:
         driver, base_url = setup
         
         driver.get(f"{base_url}/register.htm")
-        time.sleep(1)
         
         register_page = RegisterPage(driver)
         user_data = TestData.get_valid_user_data()
         user_data['username'] = "' OR '1'='1"
         
         register_page.register_user(user_data)
-        time.sleep(2)
         
         # If it registers successfuly with SQLi payload as username, it's just a string to the app
         # If it crashes or behaves weirdly, we'd see errors.
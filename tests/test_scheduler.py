@@ -0,0 +1,66 @@
+"""
+SCHEDULER - UNIT TESTS (no browser)
+"""
+
+import argparse
+import sys
+import os
+from types import SimpleNamespace
+
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utilities.scheduler import lpt_partition, parse_shard
+
+
+def make_items(durations):
+    """Stand-ins for collected items: only nodeid is used by lpt_partition"""
+    items = [SimpleNamespace(nodeid=f"tests/test_x.py::test_{index}") for index in range(len(durations))]
+    estimates = {item.nodeid: duration for item, duration in zip(items, durations)}
+    return items, estimates
+
+
+class TestLptPartition:
+
+    def test_bins_are_balanced(self):
+        """Every test lands in exactly one bin and the bins end up within one short test of each other"""
+        items, estimates = make_items([8, 7, 6, 5, 4, 3, 2, 2, 1, 1])
+
+        bins = lpt_partition(items, estimates, 3)
+
+        assert sorted(item.nodeid for bin_items in bins for item in bin_items) == sorted(estimates)
+        loads = [sum(estimates[item.nodeid] for item in bin_items) for bin_items in bins]
+        assert max(loads) - min(loads) <= 1, f"Unbalanced bins: {loads}"
+
+    def test_longest_tests_are_spread_first(self):
+        """The three longest tests start three different bins"""
+        items, estimates = make_items([10, 9, 8, 1])
+
+        bins = lpt_partition(items, estimates, 3)
+
+        assert [bin_items[0].nodeid for bin_items in bins] == [items[0].nodeid, items[1].nodeid, items[2].nodeid]
+
+    def test_more_bins_than_tests(self):
+        items, estimates = make_items([3, 1])
+
+        bins = lpt_partition(items, estimates, 4)
+
+        assert [len(bin_items) for bin_items in bins] == [1, 1, 0, 0]
+
+
+class TestParseShard:
+
+    def test_valid_shard(self):
+        assert parse_shard("2/4") == (2, 4)
+
+    @pytest.mark.parametrize("value", ["x", "1", "1/2/3", "a/b", ""])
+    def test_malformed_shard(self, value):
+        with pytest.raises(argparse.ArgumentTypeError, match="expected i/n"):
+            parse_shard(value)
+
+    @pytest.mark.parametrize("value", ["0/2", "3/2", "1/0", "-1/2"])
+    def test_shard_out_of_range(self, value):
+        with pytest.raises(argparse.ArgumentTypeError, match="out of range"):
+            parse_shard(value)
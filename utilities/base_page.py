@@ -1,38 +1,161 @@
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import NoSuchElementException
 import sys
 import os
 
 # Add project root to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-try:
-    from utilities.config_reader import ConfigReader
-except ImportError:
-    # Fallback if config_reader fails
-    class ConfigReader:
-        def get_base_url(self):
-            return "https://parabank.parasoft.com/parabank"
-        def get_timeout(self):
-            return 10
+from utilities.config_reader import ConfigReader
+from utilities.element_registry import ElementRegistry
+from utilities.waits import page_is_ready, url_changed_from, network_idle
+from utilities.wait_policy import WaitPolicy
+from utilities.instrumentation import instrument_class
+
+
+# Resolves each [by, value, text] entry and sets its value in a single round-trip.
+# A null text on a <select> picks the first option. Returns the locators not found.
+FILL_FIELDS_SCRIPT = """
+var fields = arguments[0];
+var missing = [];
+
+function resolve(by, value) {
+    switch (by) {
+        case 'id': return document.getElementById(value);
+        case 'name': return document.getElementsByName(value)[0] || null;
+        case 'css selector': return document.querySelector(value);
+        case 'class name': return document.getElementsByClassName(value)[0] || null;
+        case 'tag name': return document.getElementsByTagName(value)[0] || null;
+        case 'xpath':
+            return document.evaluate(value, document, null,
+                XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    }
+    return null;
+}
+
+fields.forEach(function (field) {
+    var element = resolve(field[0], field[1]);
+    if (!element) {
+        missing.push(field[1]);
+        return;
+    }
+    var text = field[2];
+    if (element.tagName === 'SELECT') {
+        if (text === null) {
+            if (element.options.length) { element.selectedIndex = 0; }
+        } else {
+            element.value = text;
+        }
+    } else {
+        // Use the native setter so frameworks tracking the value see the change
+        var proto = element.tagName === 'TEXTAREA'
+            ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+        Object.getOwnPropertyDescriptor(proto, 'value').set.call(element, text);
+    }
+    element.dispatchEvent(new Event('input', {bubbles: true}));
+    element.dispatchEvent(new Event('change', {bubbles: true}));
+});
+return missing;
+"""
 
 
 class BasePage:
+    def __init_subclass__(cls, **kwargs):
+        # Page-object methods show up as timed steps in the per-test timeline
+        super().__init_subclass__(**kwargs)
+        instrument_class(cls)
+    
     def __init__(self, driver):
         self.driver = driver
         self.config = ConfigReader()
-        self.wait = WebDriverWait(driver, self.config.get_timeout())
+        # Every timeout goes through the wait policy; the implicit wait stays off
+        self.wait = WaitPolicy(driver, self.config.get_timeout())
+        # Element handles found on the current page load, shared by all pages on this driver
+        self.elements = ElementRegistry.for_driver(driver)
+    
+    def element(self, by_locator, condition=EC.visibility_of_element_located, timeout=None):
+        """Element for the locator; only the first lookup per page load and condition waits and finds it"""
+        return self.elements.get((by_locator, condition),
+                                 lambda: self.wait.until(condition(by_locator), timeout=timeout))
+    
+    def with_element(self, by_locator, action, condition=EC.visibility_of_element_located, timeout=None):
+        """Run action(element), re-resolving the element once if its cached handle went stale"""
+        return self.elements.use((by_locator, condition),
+                                 lambda: self.wait.until(condition(by_locator), timeout=timeout),
+                                 action)
     
     def click(self, by_locator):
-        self.wait.until(EC.element_to_be_clickable(by_locator)).click()
+        self.with_element(by_locator, lambda element: element.click(), EC.element_to_be_clickable)
     
     def send_keys(self, by_locator, text):
-        self.wait.until(EC.visibility_of_element_located(by_locator)).send_keys(text)
+        self.with_element(by_locator, lambda element: element.send_keys(text))
     
     def get_element_text(self, by_locator):
-        element = self.wait.until(EC.visibility_of_element_located(by_locator))
-        return element.text
+        return self.with_element(by_locator, lambda element: element.text)
+    
+    def is_visible(self, by_locator, timeout=None):
+        return self.with_element(by_locator, lambda element: element.is_displayed(), timeout=timeout)
+    
+    def is_present(self, by_locator):
+        """Zero-wait check that the element is in the DOM"""
+        return len(self.wait.probe(by_locator)) > 0
     
-    def is_visible(self, by_locator):
-        element = self.wait.until(EC.visibility_of_element_located(by_locator))
-        return bool(element)
\ No newline at end of file
+    def fill_fields(self, values, keystroke_fields=()):
+        """Fill several fields at once: {locator: text}
+        
+        All values are set by one execute_script call that fires input/change
+        events. Locators listed in keystroke_fields are typed with real
+        keystrokes instead, for fields whose handlers need key events.
+        A None value on a <select> selects its first option.
+        """
+        if not values:
+            return self
+        
+        # Same readiness guard as send_keys, once for the whole form
+        first_locator = next(iter(values))
+        self.element(first_locator, EC.presence_of_element_located)
+        
+        batched = [[by, value, text] for (by, value), text in values.items()
+                   if (by, value) not in keystroke_fields]
+        if batched:
+            missing = self.driver.execute_script(FILL_FIELDS_SCRIPT, batched)
+            if missing:
+                raise NoSuchElementException(f"Fields not found: {', '.join(missing)}")
+        
+        def replace_text(element, text):
+            # Typed fields replace their value like the batched ones do
+            element.clear()
+            element.send_keys(text)
+        
+        for locator in keystroke_fields:
+            if locator in values:
+                self.with_element(locator, lambda element, text=values[locator]: replace_text(element, text))
+        return self
+    
+    # ============ SYNCHRONIZATION ============
+    
+    def open(self, url):
+        """Load a URL and wait until the document is ready (drops cached elements)"""
+        self.driver.get(url)
+        self.wait_for_page_ready()
+        return self
+    
+    def wait_for_page_ready(self, timeout=None):
+        self.wait.until(page_is_ready(), timeout=timeout)
+    
+    def wait_for_url_change(self, old_url, timeout=None):
+        self.wait.until(url_changed_from(old_url), timeout=timeout)
+    
+    def wait_for_url_contains(self, fragment, timeout=None):
+        self.wait.until(EC.url_contains(fragment), timeout=timeout)
+    
+    def wait_for_staleness(self, element, timeout=None):
+        """Wait until an element is detached, i.e. the page it lived on was replaced"""
+        self.wait.until(EC.staleness_of(element), timeout=timeout)
+        self.elements.clear()
+    
+    def wait_for_network_idle(self, quiet_period=0.5, timeout=None):
+        self.wait.until(network_idle(quiet_period), timeout=timeout)
+
+
+instrument_class(BasePage)
@@ -0,0 +1,106 @@
+"""
+Named browser profiles (fast, debug, visual) for Chrome and Firefox
+
+A profile decides headless mode, page-load strategy, window size and which
+requests are blocked. Pick one with --browser-profile or [browser] profile
+in config.ini.
+"""
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+
+
+PROFILES = {
+    # CI default: headless, interactive as soon as the DOM is ready, no images or trackers
+    'fast': {
+        'headless': True,
+        'page_load_strategy': 'eager',
+        'window_size': (1366, 768),
+        'maximize': False,
+        'block_images': True,
+        'block_third_party': True,
+    },
+    # Local debugging: visible, maximized browser that loads everything
+    'debug': {
+        'headless': False,
+        'page_load_strategy': 'normal',
+        'window_size': (1920, 1080),
+        'maximize': True,
+        'block_images': False,
+        'block_third_party': False,
+    },
+    # Screenshots and visual checks: headless but fully rendered
+    'visual': {
+        'headless': True,
+        'page_load_strategy': 'normal',
+        'window_size': (1920, 1080),
+        'maximize': False,
+        'block_images': False,
+        'block_third_party': True,
+    },
+}
+
+IMAGE_URL_PATTERNS = ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+                      "*.woff", "*.woff2", "*.ttf", "*.otf"]
+
+DEFAULT_THIRD_PARTY_HOSTS = ["google-analytics.com", "googletagmanager.com", "doubleclick.net",
+                             "fonts.googleapis.com", "fonts.gstatic.com", "facebook.net"]
+
+
+def get_profile(name):
+    if name not in PROFILES:
+        raise ValueError(f"Unknown browser profile '{name}'. Choose from: {', '.join(PROFILES)}")
+    return PROFILES[name]
+
+
+def chrome_options(profile):
+    options = webdriver.ChromeOptions()
+    if profile['headless']:
+        options.add_argument('--headless=new')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--disable-extensions')
+    options.add_argument('--window-size=%d,%d' % profile['window_size'])
+    options.page_load_strategy = profile['page_load_strategy']
+    # Keep the console log available for failure artifacts
+    options.set_capability('goog:loggingPrefs', {'browser': 'ALL'})
+    if profile['block_images']:
+        options.add_experimental_option(
+            'prefs', {'profile.managed_default_content_settings.images': 2})
+    return options
+
+
+def firefox_options(profile, third_party_hosts=()):
+    options = webdriver.FirefoxOptions()
+    if profile['headless']:
+        options.add_argument('-headless')
+    options.add_argument('--width=%d' % profile['window_size'][0])
+    options.add_argument('--height=%d' % profile['window_size'][1])
+    options.page_load_strategy = profile['page_load_strategy']
+    options.set_preference('extensions.enabled', False)
+    if profile['block_images']:
+        options.set_preference('permissions.default.image', 2)
+        options.set_preference('browser.display.use_document_fonts', 0)
+    if profile['block_third_party']:
+        # Firefox has no CDP blocking - resolve third-party hosts to nowhere instead
+        options.set_preference('network.dns.localDomains', ','.join(third_party_hosts))
+    return options
+
+
+def apply_request_blocking(driver, profile, third_party_hosts=()):
+    """Block images/fonts and third-party hosts through CDP (Chrome only)"""
+    patterns = []
+    if profile['block_images']:
+        patterns += IMAGE_URL_PATTERNS
+    if profile['block_third_party']:
+        patterns += [f"*{host}*" for host in third_party_hosts]
+    if not patterns or not hasattr(driver, 'execute_cdp_cmd'):
+        return False
+
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+        return True
+    except WebDriverException as e:
+        print(f"Could not enable request blocking: {e}")
+        return False
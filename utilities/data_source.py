@@ -0,0 +1,133 @@
+"""
+CSV/XLSX data sources for data-driven tests
+
+iter_rows() streams a sheet row by row (csv.DictReader, openpyxl in
+read-only mode). Parametrization needs every row at collection time, so
+load_rows() reads the whole sheet into a list and caches it in memory and
+on disk keyed by the file's mtime and size; repeated collection - e.g. by
+every xdist worker - does not parse the same workbook again.
+
+    @parametrize_from("test_data/bill_pay_amounts.csv")
+    def test_amount(self, setup_bill_pay, amount):
+        ...
+"""
+
+import csv
+import hashlib
+import json
+import os
+
+import pytest
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CACHE_DIR = os.path.join(PROJECT_ROOT, ".data_cache")
+ID_COLUMN = "case_id"
+
+_memory_cache = {}
+
+
+class DataSourceError(ValueError):
+    """A data sheet has no header or no rows, or lacks a requested column"""
+
+
+def _resolve(path):
+    return path if os.path.isabs(path) else os.path.join(PROJECT_ROOT, path)
+
+
+def _cell(value):
+    """Normalise a spreadsheet cell to the string form the page objects type"""
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def iter_rows(path, sheet=None):
+    """Yield each data row as a dict keyed by the header row - nothing is cached"""
+    path = _resolve(path)
+    if path.lower().endswith((".xlsx", ".xlsm")):
+        yield from _iter_xlsx(path, sheet)
+    else:
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            for row in csv.DictReader(f):
+                yield {key: _cell(value) for key, value in row.items()}
+
+
+def _iter_xlsx(path, sheet):
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        worksheet = workbook[sheet] if sheet else workbook.active
+        rows = worksheet.iter_rows(values_only=True)
+        header = [_cell(value) for value in next(rows, ())]
+        for values in rows:
+            if not any(value is not None for value in values):
+                continue
+            yield {key: _cell(value) for key, value in zip(header, values) if key}
+    finally:
+        workbook.close()
+
+
+def load_rows(path, sheet=None):
+    """All rows of a sheet, parsed once per file version (mtime + size)"""
+    path = _resolve(path)
+    stat = os.stat(path)
+    version = [stat.st_mtime_ns, stat.st_size]
+    key = (path, sheet)
+
+    cached = _memory_cache.get(key)
+    if cached and cached[0] == version:
+        return cached[1]
+
+    cache_file = os.path.join(CACHE_DIR, hashlib.sha1(repr(key).encode()).hexdigest() + ".json")
+    rows = _read_disk_cache(cache_file, version)
+    if rows is None:
+        rows = list(iter_rows(path, sheet))
+        _write_disk_cache(cache_file, version, rows)
+
+    _memory_cache[key] = (version, rows)
+    return rows
+
+
+def _read_disk_cache(cache_file, version):
+    try:
+        with open(cache_file) as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return entry["rows"] if entry.get("version") == version else None
+
+
+def _write_disk_cache(cache_file, version, rows):
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        with open(tmp_file, "w") as f:
+            json.dump({"version": version, "rows": rows}, f)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        print(f"Could not cache data source: {e}")
+
+
+def parametrize_from(path, sheet=None, argnames=None):
+    """pytest.mark.parametrize built from a CSV/XLSX sheet
+
+    Every column except case_id becomes an argument (or only `argnames`);
+    case_id, when present, becomes the test id.
+    """
+    rows = load_rows(path, sheet)
+    # An empty parametrize list would silently skip every test using the sheet
+    if not rows:
+        raise DataSourceError(f"{path}{f' [{sheet}]' if sheet else ''}: no header row or no data rows")
+    columns = [column for column in rows[0] if column]
+    if argnames is None:
+        argnames = [column for column in columns if column != ID_COLUMN]
+    missing = [name for name in argnames if name not in columns]
+    if not argnames or missing:
+        raise DataSourceError(f"{path}: missing argument columns {missing or 'besides case_id'}")
+
+    params = [pytest.param(*[row.get(name, "") for name in argnames], id=row.get(ID_COLUMN) or None)
+              for row in rows]
+    return pytest.mark.parametrize(argnames, params)
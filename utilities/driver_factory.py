@@ -0,0 +1,37 @@
+"""
+WebDriver factory shared by the fixtures and the driver pool
+"""
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.firefox.service import Service as FirefoxService
+from utilities.browser_profiles import (DEFAULT_THIRD_PARTY_HOSTS, get_profile, chrome_options,
+                                        firefox_options, apply_request_blocking)
+from utilities.settings import get_settings
+from utilities.driver_resolver import resolve_driver_path
+from utilities.wait_policy import disable_implicit_wait
+
+
+def create_driver(browser="chrome", profile_name=None):
+    """Launch a new browser session for the given browser and profile name"""
+    settings = get_settings()
+    profile = get_profile(profile_name or settings.browser_profile)
+    blocked_hosts = list(settings.blocked_hosts) or DEFAULT_THIRD_PARTY_HOSTS
+
+    if browser == "firefox":
+        driver = webdriver.Firefox(
+            service=FirefoxService(resolve_driver_path("firefox")),
+            options=firefox_options(profile, blocked_hosts)
+        )
+    else:
+        driver = webdriver.Chrome(
+            service=Service(resolve_driver_path("chrome")),
+            options=chrome_options(profile)
+        )
+        apply_request_blocking(driver, profile, blocked_hosts)
+
+    # Page objects own all waiting through WaitPolicy
+    disable_implicit_wait(driver)
+    if profile['maximize']:
+        driver.maximize_window()
+    return driver
@@ -0,0 +1,141 @@
+"""
+Session-scoped pool of warm WebDriver instances
+"""
+
+import threading
+import time
+from selenium.common.exceptions import WebDriverException
+
+
+RESET_STORAGE_SCRIPT = """
+try { window.localStorage.clear(); } catch (e) {}
+try { window.sessionStorage.clear(); } catch (e) {}
+"""
+
+
+class _PoolEntry:
+    """A pooled driver together with its usage counter"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.uses = 0
+
+
+class DriverPool:
+    """Hands out warm browsers per test and recycles them after N uses or a crash"""
+
+    def __init__(self, factory, max_uses=50):
+        self.factory = factory
+        self.max_uses = max_uses
+        self._idle = []
+        self._in_use = {}
+        self._lock = threading.Lock()
+
+        # Statistics for the end-of-session report
+        self.launches = 0
+        self.reuses = 0
+        self.recycled = 0
+        self.launch_time = 0.0
+
+    def acquire(self):
+        """Return a clean driver, launching a new browser only when none is idle"""
+        while True:
+            with self._lock:
+                entry = self._idle.pop() if self._idle else None
+
+            if entry is None:
+                entry = self._launch()
+                break
+
+            if self._is_alive(entry.driver):
+                self.reuses += 1
+                break
+
+            # Browser crashed while idle - throw it away and try the next one
+            self._discard(entry)
+
+        entry.uses += 1
+        with self._lock:
+            self._in_use[id(entry.driver)] = entry
+        return entry.driver
+
+    def release(self, driver, broken=False):
+        """Give a driver back; it is reset for the next test or recycled"""
+        with self._lock:
+            entry = self._in_use.pop(id(driver), None)
+        if entry is None:
+            self._quit(driver)
+            return
+
+        if broken or entry.uses >= self.max_uses:
+            self._discard(entry)
+            return
+
+        try:
+            self.reset(driver)
+        except WebDriverException:
+            self._discard(entry)
+            return
+
+        with self._lock:
+            self._idle.append(entry)
+
+    def reset(self, driver):
+        """Clear cookies and storage and park the browser on about:blank"""
+        driver.execute_script(RESET_STORAGE_SCRIPT)
+        try:
+            # Chrome can wipe cookies for every domain at once
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        except (AttributeError, WebDriverException):
+            driver.delete_all_cookies()
+        driver.get("about:blank")
+
+    def shutdown(self):
+        """Quit every browser owned by the pool"""
+        with self._lock:
+            entries = self._idle + list(self._in_use.values())
+            self._idle = []
+            self._in_use = {}
+        for entry in entries:
+            self._quit(entry.driver)
+
+    @property
+    def average_launch_time(self):
+        return self.launch_time / self.launches if self.launches else 0.0
+
+    @property
+    def launch_time_saved(self):
+        """Estimated seconds saved by reusing browsers instead of relaunching"""
+        return self.reuses * self.average_launch_time
+
+    def summary(self):
+        """One-line report of pool activity for the terminal summary"""
+        return (f"Driver pool: {self.launches} launches, {self.reuses} reuses, "
+                f"{self.recycled} recycled, avg launch {self.average_launch_time:.2f}s, "
+                f"~{self.launch_time_saved:.1f}s of launch time saved")
+
+    def _launch(self):
+        start = time.perf_counter()
+        driver = self.factory()
+        self.launch_time += time.perf_counter() - start
+        self.launches += 1
+        return _PoolEntry(driver)
+
+    def _discard(self, entry):
+        self.recycled += 1
+        self._quit(entry.driver)
+
+    @staticmethod
+    def _is_alive(driver):
+        try:
+            driver.current_url
+            return True
+        except WebDriverException:
+            return False
+
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+        except Exception as e:
+            print(f"Could not quit driver cleanly: {e}")
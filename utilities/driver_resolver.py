@@ -0,0 +1,155 @@
+"""
+Resolves the WebDriver binary path once per session and shares it between
+xdist workers through a lock file and an on-disk cache
+"""
+
+import json
+import os
+import time
+from utilities.settings import get_settings
+
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_CACHE_DIR = os.path.join(PROJECT_ROOT, ".driver_cache")
+
+
+class FileLock:
+    """Minimal cross-platform inter-process lock based on an exclusive lock file"""
+
+    def __init__(self, path, timeout=120, poll_interval=0.1):
+        self.path = path
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self._fd = None
+
+    def acquire(self):
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                self._fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.write(self._fd, str(os.getpid()).encode())
+                return
+            except FileExistsError:
+                if time.monotonic() >= deadline:
+                    # Holder most likely died - break the stale lock and retry
+                    self._break_stale_lock()
+                    deadline = time.monotonic() + self.timeout
+                time.sleep(self.poll_interval)
+
+    def release(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+
+    def _break_stale_lock(self):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+
+
+class DriverResolver:
+    """Works out driver binary paths without hitting webdriver-manager on every launch"""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, offline=None, pinned_paths=None,
+                 max_age=24 * 60 * 60):
+        settings = get_settings()
+        self.cache_dir = cache_dir
+        self.offline = settings.driver_offline if offline is None else offline
+        self.pinned_paths = pinned_paths if pinned_paths is not None else {
+            browser: settings.driver_path(browser) for browser in ("chrome", "firefox")
+        }
+        self.max_age = max_age
+        self._resolved = {}
+
+    def resolve(self, browser="chrome"):
+        """Return the driver binary path for the browser, resolving it at most once"""
+        if browser in self._resolved:
+            return self._resolved[browser]
+
+        if self.offline:
+            path = self._pinned_path(browser)
+        else:
+            path = self._shared_path(browser)
+
+        self._resolved[browser] = path
+        return path
+
+    def _pinned_path(self, browser):
+        path = self.pinned_paths.get(browser)
+        if not path:
+            raise FileNotFoundError(
+                f"Offline driver mode is on but no {browser}_driver_path is set in config.ini")
+        if not os.path.isfile(path):
+            raise FileNotFoundError(f"Pinned {browser} driver not found: {path}")
+        return path
+
+    def _shared_path(self, browser):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        cache_file = os.path.join(self.cache_dir, f"{browser}_driver.json")
+
+        path = self._read_cache(cache_file)
+        if path:
+            return path
+
+        with FileLock(os.path.join(self.cache_dir, f"{browser}_driver.lock")):
+            # Another worker may have finished the install while we waited
+            path = self._read_cache(cache_file)
+            if path:
+                return path
+
+            path = self._install(browser)
+            self._write_cache(cache_file, path)
+            return path
+
+    def _read_cache(self, cache_file):
+        try:
+            with open(cache_file) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        path = entry.get("path")
+        if not path or not os.path.isfile(path):
+            return None
+        if time.time() - entry.get("resolved_at", 0) > self.max_age:
+            return None
+        return path
+
+    @staticmethod
+    def _write_cache(cache_file, path):
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        with open(tmp_file, "w") as f:
+            json.dump({"path": path, "resolved_at": time.time()}, f)
+        os.replace(tmp_file, cache_file)
+
+    @staticmethod
+    def _install(browser):
+        if browser == "firefox":
+            from webdriver_manager.firefox import GeckoDriverManager
+            return GeckoDriverManager().install()
+
+        from webdriver_manager.chrome import ChromeDriverManager
+        return ChromeDriverManager().install()
+
+
+_resolver = None
+
+
+def resolve_driver_path(browser="chrome"):
+    """Process-wide shortcut used by the driver factory"""
+    global _resolver
+    if _resolver is None:
+        _resolver = DriverResolver()
+    return _resolver.resolve(browser)
@@ -0,0 +1,105 @@
+"""
+Per-driver cache of resolved WebElement handles
+
+Handles are keyed by (locator, wait condition): a handle found once the
+element was merely present is not handed out where the caller waits for it
+to be clickable. A handle is reused until the page it was found on goes away:
+- navigation commands (get, back, forward, refresh, window/frame switches)
+  bump the driver's page epoch and drop every cached handle
+- a StaleElementReferenceException drops the handle that raised it
+  (form submissions replace the document without a navigation command)
+"""
+
+import threading
+
+from selenium.common.exceptions import StaleElementReferenceException
+
+# Commands after which no previously found element can be used
+NAVIGATION_COMMANDS = {"get", "goBack", "goForward", "refresh",
+                       "switchToWindow", "switchToFrame", "switchToParentFrame", "newWindow"}
+
+REGISTRY_STATS = {"hits": 0, "misses": 0, "stale": 0}
+_stats_lock = threading.Lock()
+
+
+def _count(key):
+    with _stats_lock:
+        REGISTRY_STATS[key] += 1
+
+
+def registry_report():
+    """One line with the process-wide hit rate; empty before any lookup"""
+    with _stats_lock:
+        hits, misses, stale = REGISTRY_STATS["hits"], REGISTRY_STATS["misses"], REGISTRY_STATS["stale"]
+    if not hits + misses:
+        return ""
+    return (f"Element registry: {hits} hits, {misses} misses "
+            f"({100.0 * hits / (hits + misses):.0f}% hit rate), {stale} stale handles re-resolved")
+
+
+def track_navigation(driver):
+    """Count page loads on the driver so cached handles can be dropped"""
+    if getattr(driver, '_page_epoch', None) is not None:
+        return driver
+    original_execute = driver.execute
+
+    def execute(driver_command, params=None):
+        if driver_command in NAVIGATION_COMMANDS:
+            driver._page_epoch += 1
+        return original_execute(driver_command, params)
+
+    driver.execute = execute
+    driver._page_epoch = 0
+    return driver
+
+
+class ElementRegistry:
+    """Resolved element handles for the current page load of one driver"""
+
+    def __init__(self, driver):
+        self.driver = track_navigation(driver)
+        self._elements = {}
+        self._epoch = driver._page_epoch
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def for_driver(cls, driver):
+        """The registry shared by every page object built on this driver"""
+        registry = getattr(driver, '_element_registry', None)
+        if registry is None:
+            registry = cls(driver)
+            driver._element_registry = registry
+        return registry
+
+    def get(self, key, resolve):
+        """Cached handle for the key, or resolve() it and remember the result"""
+        if self._epoch != self.driver._page_epoch:
+            self.clear()
+        element = self._elements.get(key)
+        if element is not None:
+            self.hits += 1
+            _count("hits")
+            return element
+        self.misses += 1
+        _count("misses")
+        element = resolve()
+        self._elements[key] = element
+        return element
+
+    def use(self, key, resolve, action):
+        """Run action(element); a stale cached handle is resolved again once"""
+        try:
+            return action(self.get(key, resolve))
+        except StaleElementReferenceException:
+            _count("stale")
+            self.invalidate(key)
+            return action(self.get(key, resolve))
+
+    def invalidate(self, key):
+        self._elements.pop(key, None)
+
+    def clear(self):
+        """Forget every handle, e.g. after the page was replaced"""
+        self._elements.clear()
+        self._epoch = self.driver._page_epoch
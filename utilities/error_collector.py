@@ -0,0 +1,77 @@
+"""
+Collects every visible error message on the page in one injected script
+
+Replaces a scan of many separate find_elements queries (each paying a
+round-trip, and the implicit wait when nothing matches) with a single
+execute_script call that returns text, field and source for each error.
+"""
+
+from collections import namedtuple
+
+
+ErrorMessage = namedtuple("ErrorMessage", ["text", "field", "source"])
+
+ERROR_COLLECTOR_SCRIPT = """
+var TEXT_PATTERNS = ['is required', 'did not match', 'already exists'];
+var seen = new Set();
+var results = [];
+
+function isVisible(element) {
+    if (!element.getClientRects().length) { return false; }
+    var style = window.getComputedStyle(element);
+    return style.visibility !== 'hidden' && style.display !== 'none';
+}
+
+function fieldFor(element) {
+    // ParaBank renders <span id="customer.firstName.errors"> next to each input
+    if (element.id && element.id.slice(-7) === '.errors') {
+        return element.id.slice(0, -7);
+    }
+    var row = element.closest('tr');
+    var input = row && row.querySelector('input[name], select[name], textarea[name]');
+    return input ? input.getAttribute('name') : null;
+}
+
+function add(text, field, source) {
+    text = (text || '').trim();
+    if (!text || seen.has(text)) { return; }
+    seen.add(text);
+    results.push([text, field, source]);
+}
+
+document.querySelectorAll('.error, [class*="error"], font[color="red"]').forEach(function (element) {
+    if (isVisible(element)) {
+        add(element.innerText, fieldFor(element), 'element');
+    }
+});
+
+var xpath = '//*[' + TEXT_PATTERNS.map(function (pattern) {
+    return "contains(text(), '" + pattern + "')";
+}).join(' or ') + ']';
+var matches = document.evaluate(xpath, document.body, null,
+    XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+for (var i = 0; i < matches.snapshotLength; i++) {
+    var element = matches.snapshotItem(i);
+    if (isVisible(element)) {
+        add(element.innerText, fieldFor(element), 'text');
+    }
+}
+
+var rightPanel = document.getElementById('rightPanel');
+if (rightPanel && rightPanel.innerText.toLowerCase().indexOf('error') !== -1) {
+    rightPanel.innerText.split('\\n').forEach(function (line) {
+        var lower = line.toLowerCase();
+        if (lower.indexOf('error') !== -1 || lower.indexOf('please') !== -1 ||
+                lower.indexOf('required') !== -1) {
+            add(line, null, 'panel');
+        }
+    });
+}
+
+return results;
+"""
+
+
+def collect_errors(driver):
+    """Return every visible, de-duplicated error message as ErrorMessage tuples"""
+    return [ErrorMessage(*entry) for entry in driver.execute_script(ERROR_COLLECTOR_SCRIPT) or []]
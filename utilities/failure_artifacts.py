@@ -0,0 +1,165 @@
+"""
+Failure artifacts captured in teardown and processed on a background thread
+
+Only the browser round-trips (screenshot, DOM, console log) happen in the
+test's teardown. Hashing, de-duplication, image compression, gzip and disk
+writes run on a worker thread, and the artifact directory is kept under a
+size budget by evicting the oldest files.
+"""
+
+import gzip
+import hashlib
+import io
+import json
+import os
+import queue
+import threading
+import time
+
+try:
+    from PIL import Image
+    HAS_PIL = True
+except Exception:
+    HAS_PIL = False
+
+
+INDEX_FILE = "index.jsonl"
+
+
+class ArtifactPipeline:
+    """Captures failure artifacts and hands the expensive work to a background worker"""
+
+    def __init__(self, output_dir, max_bytes=200 * 1024 * 1024, image_format="webp", quality=60):
+        self.output_dir = output_dir
+        self.max_bytes = max_bytes
+        self.image_format = image_format.lower()
+        self.quality = quality
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+        # Content hash -> stored file name
+        self._seen = {}
+
+        os.makedirs(output_dir, exist_ok=True)
+        # Artifacts are named by content hash, so earlier runs count for de-duplication
+        for file_name in os.listdir(output_dir):
+            if file_name != INDEX_FILE:
+                self._seen[file_name.split(".", 1)[0]] = file_name
+
+    def capture(self, driver, test_name):
+        """Grab the raw artifacts from the browser and queue them; returns immediately after"""
+        artifacts = {'test': test_name, 'captured_at': time.time()}
+        try:
+            artifacts['screenshot'] = driver.get_screenshot_as_png()
+        except Exception as e:
+            print(f"Could not capture screenshot: {e}")
+        try:
+            artifacts['dom'] = driver.page_source
+        except Exception as e:
+            print(f"Could not capture DOM snapshot: {e}")
+        try:
+            artifacts['console'] = driver.get_log("browser")
+        except Exception:
+            # Not every driver exposes the browser console log
+            artifacts['console'] = None
+
+        self._ensure_worker()
+        self._queue.put(artifacts)
+        return artifacts.get('screenshot')
+
+    def flush(self, timeout=30):
+        """Wait until every queued artifact has been written"""
+        if self._thread is None:
+            return
+        deadline = time.monotonic() + timeout
+        while self._queue.unfinished_tasks and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+    # ============ BACKGROUND WORKER ============
+
+    def _ensure_worker(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="failure-artifacts", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            artifacts = self._queue.get()
+            try:
+                self._process(artifacts)
+            except Exception as e:
+                print(f"Could not store failure artifacts for {artifacts['test']}: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _process(self, artifacts):
+        entry = {'test': artifacts['test'], 'captured_at': artifacts['captured_at']}
+
+        if artifacts.get('screenshot'):
+            entry['screenshot'] = self._store(artifacts['screenshot'], self._encode_image)
+        if artifacts.get('dom'):
+            entry['dom'] = self._store(artifacts['dom'].encode("utf-8"), self._gzip, ".html.gz")
+        if artifacts.get('console'):
+            console = json.dumps(artifacts['console'], indent=2).encode("utf-8")
+            entry['console'] = self._store(console, self._gzip, ".json.gz")
+
+        with open(os.path.join(self.output_dir, INDEX_FILE), "a") as f:
+            f.write(json.dumps(entry) + "\n")
+        self._enforce_budget()
+
+    def _store(self, raw, encoder, suffix=None):
+        """Write raw content through encoder unless identical content is already stored"""
+        # Hash the raw bytes first: a repeated screenshot skips the encoding entirely
+        digest = hashlib.sha256(raw).hexdigest()[:16]
+        if digest in self._seen:
+            return self._seen[digest]
+
+        data, extension = encoder(raw)
+        file_name = digest + (suffix or extension)
+        path = os.path.join(self.output_dir, file_name)
+        with open(path, "wb") as f:
+            f.write(data)
+        self._seen[digest] = file_name
+        return file_name
+
+    def _encode_image(self, png):
+        if not HAS_PIL:
+            return png, ".png"
+        image = Image.open(io.BytesIO(png)).convert("RGB")
+        buffer = io.BytesIO()
+        if self.image_format == "webp":
+            image.save(buffer, format="WEBP", quality=self.quality, method=4)
+            return buffer.getvalue(), ".webp"
+        image.save(buffer, format="JPEG", quality=self.quality, optimize=True)
+        return buffer.getvalue(), ".jpg"
+
+    @staticmethod
+    def _gzip(raw):
+        return gzip.compress(raw, compresslevel=6), ".gz"
+
+    def _enforce_budget(self):
+        """Delete the oldest artifact files until the directory fits the size budget"""
+        files = []
+        total = 0
+        for file_name in os.listdir(self.output_dir):
+            if file_name == INDEX_FILE:
+                continue
+            path = os.path.join(self.output_dir, file_name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                # Removed by another xdist worker sharing the directory
+                continue
+            files.append((stat.st_mtime, stat.st_size, file_name))
+            total += stat.st_size
+
+        for _, size, file_name in sorted(files):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.output_dir, file_name))
+            except FileNotFoundError:
+                pass
+            self._seen.pop(file_name.split(".", 1)[0], None)
+            total -= size
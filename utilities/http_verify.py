@@ -0,0 +1,201 @@
+"""
+Browser-free verification of bill-pay form submissions
+
+Posts the same payload BillPayPage.fill_form would submit straight to
+billpay.htm over a pooled, logged-in requests session and classifies the
+returned HTML the way utilities.outcome does in the browser:
+
+    client = BillPayClient(user_provisioner.session_for(user), base_url)
+    outcome = client.submit(TestData.get_valid_bill_pay_data())
+
+Responses are parsed in a single pass with the standard library's
+html.parser - no extra dependency, and a ParaBank page parses in well
+under a millisecond.
+"""
+
+from html.parser import HTMLParser
+
+from pages.bill_pay_page import BillPayPage
+from utilities.outcome import Outcome, PageOutcome
+from utilities.settings import get_settings
+
+# TestData keys -> form field names of the bill-pay form
+BILL_PAY_FORM_FIELDS = {
+    'payee_name': BillPayPage.PAYEE_NAME[1],
+    'payee_address': BillPayPage.PAYEE_ADDRESS[1],
+    'payee_city': BillPayPage.PAYEE_CITY[1],
+    'payee_state': BillPayPage.PAYEE_STATE[1],
+    'payee_zip': BillPayPage.PAYEE_ZIP_CODE[1],
+    'payee_phone': BillPayPage.PAYEE_PHONE[1],
+    'payee_account': BillPayPage.PAYEE_ACCOUNT[1],
+    'amount': BillPayPage.AMOUNT[1],
+}
+BILL_PAY_SUCCESS_ID = BillPayPage.RESULT_PANEL[1]
+
+VOID_ELEMENTS = {"area", "base", "br", "col", "embed", "hr", "img", "input",
+                 "link", "meta", "param", "source", "track", "wbr"}
+
+
+def bill_pay_payload(bill_data, from_account=""):
+    """The form fields the bill-pay tests submit through BillPayPage.fill_form for bill_data"""
+    payload = {field: bill_data.get(key, '') for key, field in BILL_PAY_FORM_FIELDS.items()}
+    # TestData leaves verify_account empty: the tests fill it with the payee account
+    payload[BillPayPage.VERIFY_ACCOUNT[1]] = bill_data.get('verify_account') or bill_data.get('payee_account', '')
+    payload[BillPayPage.FROM_ACCOUNT[1]] = from_account
+    return payload
+
+
+def _hidden(attrs):
+    """Elements the browser would not render (inline display:none, ng-hide, hidden)"""
+    style = (attrs.get('style') or '').replace(" ", "").lower()
+    classes = (attrs.get('class') or '').split()
+    return 'display:none' in style or 'ng-hide' in classes or 'hidden' in attrs
+
+
+def _classify(success_text, titles, server_detail, errors, success_title=None):
+    """Same precedence as OUTCOME_SCRIPT: result panel, error title, success title, error spans"""
+    if success_text is not None:
+        return PageOutcome(Outcome.SUCCESS, success_text)
+    for title in titles:
+        if title == "Error!":
+            return PageOutcome(Outcome.SERVER_ERROR, server_detail or title)
+        if success_title and title.startswith(success_title):
+            return PageOutcome(Outcome.SUCCESS, title)
+    if errors:
+        return PageOutcome(Outcome.VALIDATION_ERROR, "; ".join(errors))
+    return PageOutcome(Outcome.UNKNOWN, titles[0] if titles else "")
+
+
+class _OutcomeParser(HTMLParser):
+    """Collects the visible result markers of a ParaBank page in one pass"""
+
+    def __init__(self, success_id):
+        super().__init__(convert_charrefs=True)
+        self.success_id = success_id
+        self.stack = []
+        self.success_text = None
+        self.titles = []
+        self.errors = []
+        self.server_detail = None
+        self.from_accounts = []
+        # Open capture: [kind, stack depth, collected text]
+        self._captures = []
+        self._hidden_depth = None
+        self._panel_depth = None
+        self._success_depth = None
+        self._in_from_select = False
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == "option" and self._in_from_select and attrs.get('value'):
+            self.from_accounts.append(attrs['value'])
+        if tag == "select":
+            self._in_from_select = attrs.get('name') == BillPayPage.FROM_ACCOUNT[1]
+        if tag in VOID_ELEMENTS:
+            return
+        self.stack.append(tag)
+        depth = len(self.stack)
+        if self._hidden_depth is None and _hidden(attrs):
+            self._hidden_depth = depth
+        if self._hidden_depth is not None:
+            return
+
+        classes = (attrs.get('class') or '').split()
+        if attrs.get('id') == "rightPanel":
+            self._panel_depth = depth
+        if self.success_id and attrs.get('id') == self.success_id:
+            self._success_depth = depth
+            self._captures.append(["success", depth, []])
+        elif self._success_depth is not None and tag == "h1":
+            self._captures.append(["success_heading", depth, []])
+        if self._panel_depth is not None:
+            if tag == "h1" and "title" in classes:
+                self._captures.append(["title", depth, []])
+            if "error" in classes:
+                self._captures.append(["server_detail" if tag == "p" else "error", depth, []])
+
+    def handle_data(self, data):
+        if self._hidden_depth is None:
+            for capture in self._captures:
+                capture[2].append(data)
+
+    def handle_endtag(self, tag):
+        if tag == "select":
+            self._in_from_select = False
+        if tag not in self.stack:
+            return
+        # Close implicitly ended elements too (<p> without </p> and the like)
+        while self.stack:
+            depth = len(self.stack)
+            self._close(depth)
+            if self.stack.pop() == tag:
+                break
+
+    def _close(self, depth):
+        if self._hidden_depth == depth:
+            self._hidden_depth = None
+        while self._captures and self._captures[-1][1] == depth:
+            kind, _, parts = self._captures.pop()
+            text = " ".join("".join(parts).split())
+            if kind == "success_heading":
+                self.success_text = text
+            elif kind == "success" and self.success_text is None:
+                self.success_text = text
+            elif kind == "title":
+                self.titles.append(text)
+            elif kind == "error" and text:
+                self.errors.append(text)
+            elif kind == "server_detail":
+                self.server_detail = self.server_detail or text
+                if text:
+                    self.errors.append(text)
+        if self._success_depth == depth:
+            self._success_depth = None
+        if self._panel_depth == depth:
+            self._panel_depth = None
+
+
+def parse_outcome(markup, success_id=None, success_title=None):
+    """Classify a ParaBank response body like detect_outcome classifies the rendered page"""
+    parser = _OutcomeParser(success_id)
+    parser.feed(markup)
+    parser.close()
+    return _classify(parser.success_text, parser.titles, parser.server_detail, parser.errors, success_title)
+
+
+def from_account_options(markup):
+    """Values of the fromAccountId dropdown on billpay.htm"""
+    parser = _OutcomeParser(None)
+    parser.feed(markup)
+    parser.close()
+    return parser.from_accounts
+
+
+class BillPayClient:
+    """Submits bill-pay forms over a logged-in HTTP session"""
+
+    def __init__(self, session, base_url=None, timeout=None):
+        settings = get_settings()
+        self.session = session
+        self.base_url = (base_url or settings.base_url).rstrip("/")
+        self.timeout = timeout or settings.timeout
+        self._from_account = None
+
+    def url(self, page):
+        return f"{self.base_url}/{page}"
+
+    def from_account(self):
+        """First account of the logged-in user, read once from the form like the page object's default"""
+        if self._from_account is None:
+            response = self.session.get(self.url("billpay.htm"), timeout=self.timeout)
+            accounts = from_account_options(response.text)
+            self._from_account = accounts[0] if accounts else ""
+        return self._from_account
+
+    def submit(self, bill_data):
+        """Post bill_data to billpay.htm and classify the response"""
+        payload = bill_pay_payload(bill_data, self.from_account())
+        response = self.session.post(self.url("billpay.htm"), data=payload, timeout=self.timeout)
+        if response.status_code >= 500:
+            return PageOutcome(Outcome.SERVER_ERROR, f"HTTP {response.status_code}")
+        return parse_outcome(response.text, success_id=BILL_PAY_SUCCESS_ID)
@@ -0,0 +1,180 @@
+"""
+Per-step timing for page objects and raw WebDriver commands
+
+Page-object methods (every public BasePage method and subclass method) and
+driver commands are timed while a test timeline is active. Each test gets a
+JSON timeline and, when allure is installed, an Allure step tree. A session
+summary reports p50/p95/p99 per action.
+"""
+
+import functools
+import json
+import math
+import os
+import re
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+try:
+    import allure
+    HAS_ALLURE = True
+except Exception:
+    HAS_ALLURE = False
+
+
+_local = threading.local()
+
+
+class Timeline:
+    """Ordered timing events of a single test"""
+
+    def __init__(self, test_id):
+        self.test_id = test_id
+        self.started = time.perf_counter()
+        self.events = []
+        self.depth = 0
+
+    def to_dict(self):
+        return {
+            'test_id': self.test_id,
+            'total_ms': round((time.perf_counter() - self.started) * 1000, 3),
+            'events': self.events,
+        }
+
+
+class TimingCollector:
+    """Session-wide samples per action, used for the percentile summary"""
+
+    def __init__(self):
+        self.samples = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def add_timeline(self, timeline):
+        with self._lock:
+            for event in timeline.events:
+                self.samples[event['name']].append(event['duration_ms'])
+
+    def merge(self, samples):
+        with self._lock:
+            for name, values in samples.items():
+                self.samples[name].extend(values)
+
+    def summary(self):
+        rows = {}
+        for name, values in self.samples.items():
+            ordered = sorted(values)
+            rows[name] = {
+                'count': len(ordered),
+                'total_ms': round(sum(ordered), 3),
+                'p50_ms': percentile(ordered, 50),
+                'p95_ms': percentile(ordered, 95),
+                'p99_ms': percentile(ordered, 99),
+            }
+        return dict(sorted(rows.items(), key=lambda item: item[1]['total_ms'], reverse=True))
+
+
+def percentile(ordered, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not ordered:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100.0 * len(ordered)))
+    return round(ordered[rank - 1], 3)
+
+
+def start_timeline(test_id):
+    _local.timeline = Timeline(test_id)
+    return _local.timeline
+
+
+def stop_timeline():
+    timeline = getattr(_local, 'timeline', None)
+    _local.timeline = None
+    return timeline
+
+
+def current_timeline():
+    return getattr(_local, 'timeline', None)
+
+
+@contextmanager
+def step(name, kind="step"):
+    """Time a block as a step of the active timeline (no-op when none is active)"""
+    timeline = current_timeline()
+    if timeline is None:
+        yield
+        return
+
+    event = {
+        'name': name,
+        'kind': kind,
+        'test_id': timeline.test_id,
+        'depth': timeline.depth,
+        'start_ms': round((time.perf_counter() - timeline.started) * 1000, 3),
+    }
+    timeline.events.append(event)
+    timeline.depth += 1
+    start = time.perf_counter()
+    try:
+        if HAS_ALLURE and kind == "step":
+            with allure.step(name):
+                yield
+        else:
+            yield
+    finally:
+        event['duration_ms'] = round((time.perf_counter() - start) * 1000, 3)
+        timeline.depth -= 1
+
+
+def timed(func):
+    """Wrap a method so each call becomes a step labelled with the page class and method"""
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        if current_timeline() is None:
+            return func(self, *args, **kwargs)
+        with step(f"{type(self).__name__}.{func.__name__}"):
+            return func(self, *args, **kwargs)
+    wrapper.__timed__ = True
+    return wrapper
+
+
+def instrument_class(cls):
+    """Wrap the public methods defined on cls with step timers"""
+    for name, attr in list(vars(cls).items()):
+        if name.startswith('_') or not callable(attr) or getattr(attr, '__timed__', False):
+            continue
+        if isinstance(attr, (staticmethod, classmethod)):
+            continue
+        setattr(cls, name, timed(attr))
+    return cls
+
+
+def instrument_driver(driver):
+    """Time every raw WebDriver command sent by this driver"""
+    if getattr(driver, '_instrumented', False):
+        return driver
+    original_execute = driver.execute
+
+    def execute(driver_command, params=None):
+        if current_timeline() is None:
+            return original_execute(driver_command, params)
+        kind = "step" if driver_command == "get" else "command"
+        with step(f"webdriver.{driver_command}", kind):
+            return original_execute(driver_command, params)
+
+    driver.execute = execute
+    driver._instrumented = True
+    return driver
+
+
+def safe_file_name(test_id):
+    return re.sub(r'[^A-Za-z0-9_.-]+', '_', test_id).strip('_')[:150]
+
+
+def write_json(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
@@ -0,0 +1,92 @@
+"""
+Outcome detection from ParaBank's result markers
+
+One targeted script inspects the visible result panel, the rightPanel
+title and the visible error spans, instead of downloading page_source or
+the whole body text for every assertion.
+"""
+
+from collections import namedtuple
+from enum import Enum
+
+from selenium.common.exceptions import WebDriverException
+
+
+class Outcome(Enum):
+    SUCCESS = "success"
+    VALIDATION_ERROR = "validation_error"
+    SERVER_ERROR = "server_error"
+    UNKNOWN = "unknown"
+
+
+PageOutcome = namedtuple("PageOutcome", ["outcome", "message"])
+
+OUTCOME_SCRIPT = """
+var successSelector = arguments[0];
+var successTitle = arguments[1];
+
+function visible(element) {
+    return !!element && element.getClientRects().length > 0 &&
+        window.getComputedStyle(element).visibility !== 'hidden';
+}
+function text(element) {
+    return (element.innerText || '').trim();
+}
+
+if (successSelector) {
+    var result = document.querySelector(successSelector);
+    if (visible(result)) {
+        var heading = result.querySelector('h1');
+        return ['success', text(heading || result)];
+    }
+}
+
+var titles = Array.prototype.filter.call(
+    document.querySelectorAll('#rightPanel h1.title'), visible).map(text);
+for (var i = 0; i < titles.length; i++) {
+    if (titles[i] === 'Error!') {
+        var detail = document.querySelector('#rightPanel p.error');
+        return ['server_error', detail ? text(detail) : titles[i]];
+    }
+    if (successTitle && titles[i].indexOf(successTitle) === 0) {
+        return ['success', titles[i]];
+    }
+}
+
+var errors = Array.prototype.filter.call(
+    document.querySelectorAll('#rightPanel .error'), visible).map(text).filter(Boolean);
+if (errors.length) {
+    return ['validation_error', errors.join('; ')];
+}
+return ['unknown', titles.length ? titles[0] : ''];
+"""
+
+
+def detect_outcome(driver, success_selector=None, success_title=None):
+    """Classify the current page as success, validation error, server error or unknown
+
+    success_selector: CSS selector of a result container that is visible on success
+    success_title: prefix of the rightPanel <h1 class="title"> shown on success
+    """
+    outcome, message = driver.execute_script(OUTCOME_SCRIPT, success_selector, success_title)
+    return PageOutcome(Outcome(outcome), message)
+
+
+class outcome_detected:
+    """Wait condition: the page shows any result marker; returns the PageOutcome
+
+    Polls the same script as detect_outcome, so an empty or hidden error span
+    never satisfies it the way a locator-based visibility check would.
+    """
+
+    def __init__(self, success_selector=None, success_title=None):
+        self.success_selector = success_selector
+        self.success_title = success_title
+
+    def __call__(self, driver):
+        try:
+            outcome = detect_outcome(driver, self.success_selector, self.success_title)
+        except WebDriverException:
+            # The document is being replaced by the form post
+            return False
+        return outcome if outcome.outcome != Outcome.UNKNOWN else False
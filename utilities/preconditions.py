@@ -0,0 +1,134 @@
+"""
+Precondition health: a session-start probe of the pages every suite depends
+on, and circuit breakers that skip dependent tests once their setup keeps
+failing
+
+    health = PreconditionHealth.probe(base_url)
+    health.require("register.htm")              # skip if the probe failed
+    with health.breaker(BILL_PAY_SETUP).guard():
+        ...                                     # count failures; skip after K in a row
+
+Breakers are per process, so each xdist worker trips its own.
+"""
+
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+import pytest
+import requests
+
+
+ProbeResult = namedtuple("ProbeResult", ["page", "ok", "detail"])
+
+# Page -> text that must appear in the response (None: reachable is enough).
+# billpay.htm needs a session, so without one only its reachability is checked.
+PROBED_PAGES = {
+    "index.htm": 'name="username"',
+    "register.htm": "customer.firstName",
+    "billpay.htm": None,
+}
+
+# Breaker guarding the login/registration every bill-pay test needs
+BILL_PAY_SETUP = "bill-pay setup"
+
+
+def probe_page(session, base_url, page, marker, timeout):
+    """One GET with a short timeout; never raises"""
+    try:
+        response = session.get(f"{base_url}/{page}", timeout=timeout)
+    except requests.RequestException as e:
+        return ProbeResult(page, False, type(e).__name__)
+    if response.status_code >= 400:
+        return ProbeResult(page, False, f"HTTP {response.status_code}")
+    if marker and marker not in response.text:
+        return ProbeResult(page, False, f"'{marker}' missing from the page")
+    return ProbeResult(page, True, f"HTTP {response.status_code}")
+
+
+class CircuitBreaker:
+    """Opens after `threshold` consecutive failures; dependent tests are then skipped"""
+
+    def __init__(self, name, threshold=3):
+        self.name = name
+        self.threshold = threshold
+        self.consecutive_failures = 0
+        self.last_error = None
+        self.skipped = 0
+
+    @property
+    def is_open(self):
+        return self.consecutive_failures >= self.threshold
+
+    def record_success(self):
+        self.consecutive_failures = 0
+        self.last_error = None
+
+    def record_failure(self, error):
+        self.consecutive_failures += 1
+        self.last_error = f"{type(error).__name__}: {error}".strip()
+
+    def check(self):
+        """Skip the current test when the breaker is open"""
+        if self.is_open:
+            self.skipped += 1
+            pytest.skip(f"{self.name} failed {self.consecutive_failures} times in a row "
+                        f"(last: {self.last_error}) - skipping instead of waiting for timeouts")
+
+    @contextmanager
+    def guard(self):
+        """Check the breaker, then count the wrapped setup as a success or failure"""
+        self.check()
+        try:
+            yield
+        except Exception as e:
+            # pytest.skip/fail raise BaseException subclasses and are not counted
+            self.record_failure(e)
+            raise
+        self.record_success()
+
+
+class PreconditionHealth:
+    """Probe results for the session plus one circuit breaker per named precondition"""
+
+    def __init__(self, results=None, threshold=3):
+        self.results = {result.page: result for result in (results or [])}
+        self.threshold = threshold
+        self._breakers = {}
+
+    @classmethod
+    def probe(cls, base_url, timeout=5, threshold=3, pages=None):
+        """Probe all pages in parallel, so a dead host costs one timeout, not three"""
+        pages = PROBED_PAGES if pages is None else pages
+        base_url = base_url.rstrip("/")
+        with requests.Session() as session, ThreadPoolExecutor(max_workers=len(pages) or 1) as executor:
+            results = list(executor.map(
+                lambda item: probe_page(session, base_url, item[0], item[1], timeout), pages.items()))
+        return cls(results, threshold)
+
+    def breaker(self, name):
+        if name not in self._breakers:
+            self._breakers[name] = CircuitBreaker(name, self.threshold)
+        return self._breakers[name]
+
+    def is_available(self, page):
+        """False only when the session-start probe of the page failed"""
+        result = self.results.get(page)
+        return result is None or result.ok
+
+    def require(self, *pages):
+        """Skip the current test if any of the pages failed the session-start probe"""
+        for page in pages:
+            if not self.is_available(page):
+                pytest.skip(f"Precondition failed: {page} unavailable at session start "
+                            f"({self.results[page].detail})")
+
+    def report(self):
+        """Summary lines for the terminal; empty when everything was healthy"""
+        lines = [f"probe {result.page}: {result.detail}"
+                 for result in self.results.values() if not result.ok]
+        for breaker in self._breakers.values():
+            if breaker.skipped:
+                lines.append(f"breaker {breaker.name} open: skipped {breaker.skipped} tests "
+                             f"(last: {breaker.last_error})")
+        return lines
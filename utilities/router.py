@@ -0,0 +1,62 @@
+"""
+Named ParaBank routes and navigation that skips loads the browser does not need
+
+    router = Router(driver)
+    register_page = router.open(RegisterPage)   # loads register.htm unless already there
+    router.goto("billpay")                      # no-op when the bill-pay form is showing
+
+A page is considered "already there" when the current URL has the route's
+path and, if given, the page's READY_LOCATOR is visible - a form post that
+re-renders the same URL with a result page therefore still reloads.
+"""
+
+from urllib.parse import urlparse
+
+from utilities.config_reader import ConfigReader
+from utilities.waits import page_is_ready
+from utilities.wait_policy import WaitPolicy
+
+ROUTES = {
+    "home": "index.htm",
+    "register": "register.htm",
+    "login": "login.htm",
+    "overview": "overview.htm",
+    "billpay": "billpay.htm",
+    "logout": "logout.htm",
+}
+
+
+def _path(url):
+    # ParaBank may append ;jsessionid=... to the path
+    return urlparse(url).path.split(";")[0].rstrip("/")
+
+
+class Router:
+    def __init__(self, driver, base_url=None):
+        self.driver = driver
+        config = ConfigReader()
+        self.base_url = (base_url or config.get_base_url()).rstrip("/")
+        self.wait = WaitPolicy(driver, config.get_timeout())
+
+    def url(self, route):
+        """Absolute URL of a named route ("billpay") or a page name ("billpay.htm")"""
+        return f"{self.base_url}/{ROUTES.get(route, route)}"
+
+    def is_on(self, route, ready_locator=None):
+        """True if the browser shows the route, and its ready locator when one is given"""
+        if _path(self.driver.current_url) != _path(self.url(route)):
+            return False
+        return ready_locator is None or self.wait.probe_visible(ready_locator) is not None
+
+    def goto(self, route, ready_locator=None, force=False):
+        """Load the route unless the browser is already on it; returns True if it loaded"""
+        if not force and self.is_on(route, ready_locator):
+            return False
+        self.driver.get(self.url(route))
+        self.wait.until(page_is_ready())
+        return True
+
+    def open(self, page_class, force=False):
+        """Go to the page class's ROUTE and build the page object - no load if already there"""
+        self.goto(page_class.ROUTE, getattr(page_class, "READY_LOCATOR", None), force=force)
+        return page_class(self.driver)
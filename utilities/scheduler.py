@@ -0,0 +1,193 @@
+"""
+Duration-aware test scheduling (pytest plugin, registered in conftest.py)
+
+- Records how long every test took (setup + call + teardown) in
+  .test_durations.json, smoothed across runs.
+- Runs smoke-marked tests first, fastest first, so a broken environment
+  fails within seconds.
+- With -n N --dist loadgroup, splits the tests into N groups of roughly
+  equal total duration (longest-processing-time-first) and pins each group
+  to one worker via xdist_group.
+- --shard i/n keeps only the i-th of n equally heavy shards of the full
+  collection (before -k/-m), for splitting a run across CI machines. Shards
+  are computed from the same history file, so every machine must use the
+  same copy of it.
+
+Tests without history are estimated from the median of their module, then
+of the whole suite.
+"""
+
+import argparse
+import heapq
+import json
+import os
+import re
+import statistics
+
+import pytest
+
+from utilities.instrumentation import write_json
+
+DEFAULT_HISTORY_FILE = ".test_durations.json"
+DEFAULT_ESTIMATE = 5.0
+# Weight of the newest run when smoothing recorded durations
+SMOOTHING = 0.5
+GROUP_PREFIX = "lpt"
+GROUP_SUFFIX = re.compile(r"@lpt\d+$")
+
+
+def parse_shard(value):
+    """'2/4' -> (2, 4); shards are numbered from 1"""
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected i/n, got {value!r}") from None
+    if count < 1 or not 1 <= index <= count:
+        raise argparse.ArgumentTypeError(f"shard {value!r} out of range")
+    return index, count
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("scheduler", "duration-aware scheduling")
+    group.addoption("--shard", action="store", type=parse_shard, default=None,
+                    help="Run only shard i of n, balanced by recorded durations, e.g. --shard 1/3")
+    group.addoption("--durations-file", action="store", default=DEFAULT_HISTORY_FILE,
+                    help="Per-test duration history used for ordering and sharding")
+    group.addoption("--no-reorder", action="store_true", default=False,
+                    help="Keep file order: no smoke-first ordering or duration grouping")
+
+
+class DurationHistory:
+    """Per-test durations in seconds, keyed by node id"""
+
+    def __init__(self, path):
+        self.path = path
+        self.durations = {}
+        self._current = {}
+        try:
+            with open(path) as f:
+                self.durations = json.load(f)
+        except (OSError, ValueError):
+            pass
+
+    def record(self, nodeid, seconds):
+        self._current[nodeid] = self._current.get(nodeid, 0.0) + seconds
+
+    def save(self):
+        if not self._current:
+            return
+        for nodeid, seconds in self._current.items():
+            previous = self.durations.get(nodeid)
+            self.durations[nodeid] = round(
+                seconds if previous is None else SMOOTHING * seconds + (1 - SMOOTHING) * previous, 3)
+        write_json(self.path, dict(sorted(self.durations.items())))
+
+    def estimates(self, items):
+        """Expected duration of each item, falling back to module and suite medians"""
+        suite = list(self.durations.values())
+        suite_median = statistics.median(suite) if suite else DEFAULT_ESTIMATE
+        module_medians = {}
+        for nodeid, seconds in self.durations.items():
+            module_medians.setdefault(nodeid.split("::")[0], []).append(seconds)
+        module_medians = {module: statistics.median(values) for module, values in module_medians.items()}
+
+        return {item.nodeid: self.durations.get(
+                    item.nodeid, module_medians.get(item.nodeid.split("::")[0], suite_median))
+                for item in items}
+
+
+def lpt_partition(items, estimates, count):
+    """Longest-processing-time-first: give each test to the currently lightest bin"""
+    bins = [[] for _ in range(count)]
+    loads = [(0.0, index) for index in range(count)]
+    for item in sorted(items, key=lambda item: (-estimates[item.nodeid], item.nodeid)):
+        load, index = heapq.heappop(loads)
+        bins[index].append(item)
+        heapq.heappush(loads, (load + estimates[item.nodeid], index))
+    return bins
+
+
+def smoke_first(items, estimates):
+    """Smoke tests (fastest first) ahead of everything else, which keeps its order"""
+    smoke = [item for item in items if item.get_closest_marker("smoke")]
+    smoke.sort(key=lambda item: estimates[item.nodeid])
+    smoke_ids = {id(item) for item in smoke}
+    return smoke + [item for item in items if id(item) not in smoke_ids]
+
+
+def is_xdist_worker(config):
+    return hasattr(config, "workerinput")
+
+
+class Scheduler:
+    """Orders, groups and shards the collected tests; records their durations"""
+
+    def __init__(self, config):
+        self.config = config
+        self.history = DurationHistory(os.path.join(str(config.rootpath), config.getoption("--durations-file")))
+        self.lines = []
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_collection_modifyitems(self, session, config, items):
+        """Shard and group before other plugins: xdist names groups from the markers it finds
+
+        xdist adds the "@<group>" node id suffix in its own collection hook, so the
+        xdist_group markers must exist by then. Sharding therefore splits the
+        full collection; -k/-m deselect within the shard afterwards.
+        """
+        estimates = self.history.estimates(items)
+
+        shard = config.getoption("--shard")
+        if shard:
+            index, count = shard
+            selected = lpt_partition(items, estimates, count)[index - 1]
+            selected_ids = {id(item) for item in selected}
+            deselected = [item for item in items if id(item) not in selected_ids]
+            if deselected:
+                config.hook.pytest_deselected(items=deselected)
+            items[:] = [item for item in items if id(item) in selected_ids]
+            self.lines.append(f"shard {index}/{count}: {len(items)} tests, "
+                              f"~{sum(estimates[item.nodeid] for item in items):.0f}s expected")
+
+        if config.getoption("--no-reorder"):
+            return
+
+        # Only --dist loadgroup acts on the markers; other modes ignore them
+        workers = config.workerinput.get("workercount", 1) if is_xdist_worker(config) else 1
+        if workers > 1:
+            self.assign_groups(items, estimates, workers)
+
+    @staticmethod
+    def assign_groups(items, estimates, workers):
+        """Pin one LPT bin to each worker; tests with their own xdist_group are left alone
+
+        Every worker collects the same items and history, so the groups agree.
+        """
+        ungrouped = [item for item in items if not item.get_closest_marker("xdist_group")]
+        for number, group in enumerate(lpt_partition(ungrouped, estimates, workers)):
+            for item in group:
+                item.add_marker(pytest.mark.xdist_group(name=f"{GROUP_PREFIX}{number}"))
+
+    def pytest_report_collectionfinish(self, config, start_path, items):
+        return self.lines
+
+    def pytest_runtest_logreport(self, report):
+        # In parallel runs the controller receives every worker's reports
+        if not is_xdist_worker(self.config):
+            self.history.record(GROUP_SUFFIX.sub("", report.nodeid), report.duration)
+
+    def pytest_sessionfinish(self, session, exitstatus):
+        if not is_xdist_worker(self.config):
+            self.history.save()
+
+
+def pytest_configure(config):
+    config.pluginmanager.register(Scheduler(config), "parabank_scheduler")
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(session, config, items):
+    """Smoke tests first, once every plugin has deselected what it wants"""
+    if not config.getoption("--no-reorder"):
+        scheduler = config.pluginmanager.get_plugin("parabank_scheduler")
+        items[:] = smoke_first(items, scheduler.history.estimates(items))
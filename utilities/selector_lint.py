@@ -0,0 +1,461 @@
+"""
+Selector performance linter for page-object locators
+
+Finds every (By.X, "...") tuple in pages/, flags locators that scan the
+whole document (//-rooted XPath, link text) and suggests a CSS or ID
+locator. Suggestions come from simple XPath rewrites, or from the elements
+the locator matches in the saved page snapshots (needs lxml). With a browser,
+each locator is also timed in-page against every snapshot.
+
+    python -m utilities.selector_lint                      # report
+    python -m utilities.selector_lint --time               # + in-browser timings
+    python -m utilities.selector_lint --save-snapshots     # refresh snapshots from the stub
+    python -m utilities.selector_lint --update-baseline    # accept the current findings
+
+As a pytest plugin (registered in conftest.py), --lint-selectors fails the
+run when a locator that is not in the baseline does a full-document scan
+or takes longer than --selector-threshold-us per lookup.
+"""
+
+import argparse
+import ast
+import glob
+import json
+import os
+import re
+import statistics
+import sys
+from collections import namedtuple
+
+import pytest
+from selenium.webdriver.common.by import By
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utilities.instrumentation import write_json
+
+try:
+    import lxml.html
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PAGES_DIR = os.path.join(PROJECT_ROOT, "pages")
+SNAPSHOT_DIR = os.path.join(PROJECT_ROOT, "test_data", "page_snapshots")
+BASELINE_PATH = os.path.join(PROJECT_ROOT, "test_data", "selector_baseline.json")
+DEFAULT_THRESHOLD_US = 25.0
+TIMING_ITERATIONS = 200
+
+BY_VALUES = {name: getattr(By, name) for name in
+             ("ID", "NAME", "XPATH", "CSS_SELECTOR", "CLASS_NAME", "TAG_NAME", "LINK_TEXT",
+              "PARTIAL_LINK_TEXT")}
+
+Locator = namedtuple("Locator", ["owner", "by", "value", "path", "line"])
+Finding = namedtuple("Finding", ["locator", "full_scan", "reason", "suggestion", "timing_us", "matches"])
+
+
+def locator_key(locator):
+    """Stable baseline key; changing a locator's value makes it a new locator"""
+    return f"{locator.owner}:{locator.by}={locator.value}"
+
+
+# ============ SCANNING ============
+
+class _LocatorVisitor(ast.NodeVisitor):
+    def __init__(self, path):
+        self.path = path
+        self.scope = []
+        self.found = []
+
+    def _visit_scope(self, node):
+        self.scope.append(node.name)
+        self.generic_visit(node)
+        self.scope.pop()
+
+    visit_ClassDef = visit_FunctionDef = _visit_scope
+
+    def visit_Assign(self, node):
+        # Class attributes are reported as Class.ATTR instead of just Class
+        targets = [target.id for target in node.targets if isinstance(target, ast.Name)]
+        if targets and isinstance(node.value, ast.Tuple):
+            self.scope.append(targets[0])
+            self.generic_visit(node)
+            self.scope.pop()
+        else:
+            self.generic_visit(node)
+
+    def visit_Tuple(self, node):
+        if (len(node.elts) == 2
+                and isinstance(node.elts[0], ast.Attribute)
+                and isinstance(node.elts[0].value, ast.Name) and node.elts[0].value.id == "By"
+                and node.elts[0].attr in BY_VALUES
+                and isinstance(node.elts[1], ast.Constant) and isinstance(node.elts[1].value, str)):
+            owner = ".".join(self.scope) or os.path.basename(self.path)
+            self.found.append(Locator(owner, BY_VALUES[node.elts[0].attr], node.elts[1].value,
+                                      os.path.relpath(self.path, PROJECT_ROOT), node.lineno))
+        self.generic_visit(node)
+
+
+def scan_locators(pages_dir=PAGES_DIR):
+    """Every literal locator tuple in the page objects"""
+    locators = []
+    for path in sorted(glob.glob(os.path.join(pages_dir, "*.py"))):
+        with open(path, encoding="utf-8-sig") as f:
+            tree = ast.parse(f.read(), filename=path)
+        visitor = _LocatorVisitor(path)
+        visitor.visit(tree)
+        locators.extend(visitor.found)
+    return locators
+
+
+# ============ ANALYSIS ============
+
+_QUOTED = r"""['"]([^'"]+)['"]"""
+XPATH_REWRITES = [
+    (re.compile(rf"^//[\w*]+\[@id={_QUOTED}\]$"), lambda m: (By.ID, m.group(1))),
+    (re.compile(rf"^//[\w*]+\[@name={_QUOTED}\]$"), lambda m: (By.NAME, m.group(1))),
+    (re.compile(rf"^//([\w*]+)\[contains\(@class,\s*{_QUOTED}\)\]$"),
+     lambda m: (By.CSS_SELECTOR, f"{m.group(1).strip('*')}[class*='{m.group(2)}']")),
+    (re.compile(rf"^//([\w*]+)\[@([\w-]+)={_QUOTED}\]$"),
+     lambda m: (By.CSS_SELECTOR, f"{m.group(1).strip('*')}[{m.group(2)}='{m.group(3)}']")),
+    (re.compile(r"^//(\w+)$"), lambda m: (By.TAG_NAME, m.group(1))),
+]
+
+
+def scan_reason(by, value):
+    """Why the locator walks the whole document, or None"""
+    if by == By.XPATH and value.lstrip("(").startswith("//"):
+        if "text()" in value or "contains(" in value or value.startswith("//*"):
+            return "XPath over every element with a predicate no index can answer"
+        return "XPath from the document root"
+    if by in (By.LINK_TEXT, By.PARTIAL_LINK_TEXT):
+        return "compares the text of every link"
+    return None
+
+
+def rewrite_xpath(value):
+    """Equivalent ID/NAME/CSS locator for simple XPath shapes, or None"""
+    for pattern, build in XPATH_REWRITES:
+        match = pattern.match(value)
+        if match:
+            return build(match)
+    return None
+
+
+def _css_id(element_id):
+    return "#" + re.sub(r"([^\w-])", r"\\\1", element_id)
+
+
+def css_for(element):
+    """Short locator for an lxml element: its id, else tag/class/href under the nearest id"""
+    if element.get("id"):
+        return (By.ID, element.get("id"))
+    selector = element.tag
+    if element.tag == "a" and element.get("href"):
+        selector += f"[href='{element.get('href')}']"
+    else:
+        selector += "".join(f".{name}" for name in element.get("class", "").split())
+    anchor = next((parent for parent in element.iterancestors() if parent.get("id")), None)
+    if anchor is not None:
+        selector = f"{_css_id(anchor.get('id'))} {selector}"
+    return (By.CSS_SELECTOR, selector)
+
+
+def _lxml_matches(tree, by, value):
+    if by == By.XPATH:
+        return [node for node in tree.xpath(value) if hasattr(node, "tag")]
+    if by == By.LINK_TEXT:
+        return tree.xpath("//a[normalize-space(.)=$text]", text=value)
+    if by == By.PARTIAL_LINK_TEXT:
+        return tree.xpath("//a[contains(., $text)]", text=value)
+    return []
+
+
+def load_snapshots(snapshot_dir=SNAPSHOT_DIR):
+    """name -> path of every saved page snapshot"""
+    return {os.path.splitext(os.path.basename(path))[0]: path
+            for path in sorted(glob.glob(os.path.join(snapshot_dir, "*.html")))}
+
+
+def suggest_from_snapshots(locator, snapshots):
+    """Locators for the elements this one matches in the snapshots (lxml only)"""
+    if not HAS_LXML:
+        return None
+    suggestions = []
+    for path in snapshots.values():
+        tree = lxml.html.parse(path)
+        for element in _lxml_matches(tree, locator.by, locator.value):
+            suggestion = css_for(element)
+            if suggestion not in suggestions:
+                suggestions.append(suggestion)
+    if len(suggestions) != 1:
+        # Nothing matched, or the locator means different elements on different pages
+        return None
+    return suggestions[0]
+
+
+def analyze(locators, snapshots=None, timings=None):
+    """One Finding per locator; timings maps locator_key -> (micros, matches) when measured"""
+    snapshots = load_snapshots() if snapshots is None else snapshots
+    timings = timings or {}
+    findings = []
+    for locator in locators:
+        reason = scan_reason(locator.by, locator.value)
+        suggestion = None
+        if reason:
+            suggestion = (rewrite_xpath(locator.value) if locator.by == By.XPATH else None) \
+                or suggest_from_snapshots(locator, snapshots)
+            if suggestion and "text()" in locator.value:
+                # The text condition has no CSS form - check it on the element instead
+                suggestion = (*suggestion, "check the text in Python")
+        micros, matches = timings.get(locator_key(locator), (None, None))
+        findings.append(Finding(locator, bool(reason), reason, suggestion, micros, matches))
+    return findings
+
+
+# ============ IN-BROWSER TIMING ============
+
+# Times every [by, value] lookup against the loaded document; returns [micros, matches] each
+TIMING_SCRIPT = """
+var locators = arguments[0], iterations = arguments[1];
+
+function lookup(by, value) {
+    switch (by) {
+        case 'id': return document.getElementById(value) ? 1 : 0;
+        case 'name': return document.getElementsByName(value).length;
+        case 'class name': return document.getElementsByClassName(value).length;
+        case 'tag name': return document.getElementsByTagName(value).length;
+        case 'css selector': return document.querySelectorAll(value).length;
+        case 'link text':
+        case 'partial link text':
+            var links = document.getElementsByTagName('a'), count = 0;
+            for (var i = 0; i < links.length; i++) {
+                var text = links[i].textContent.trim();
+                if (by === 'link text' ? text === value : text.indexOf(value) !== -1) count++;
+            }
+            return count;
+        default:
+            return document.evaluate(value, document, null,
+                                     XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null).snapshotLength;
+    }
+}
+
+return locators.map(function (locator) {
+    var matches = lookup(locator[0], locator[1]);
+    var start = performance.now();
+    for (var i = 0; i < iterations; i++) lookup(locator[0], locator[1]);
+    return [(performance.now() - start) * 1000 / iterations, matches];
+});
+"""
+
+
+def time_locators(driver, locators, snapshots=None, iterations=TIMING_ITERATIONS):
+    """locator_key -> (worst per-lookup micros over all snapshots, total matches)"""
+    snapshots = load_snapshots() if snapshots is None else snapshots
+    per_locator = {locator_key(locator): [] for locator in locators}
+    matches = dict.fromkeys(per_locator, 0)
+    payload = [[locator.by, locator.value] for locator in locators]
+    for path in snapshots.values():
+        driver.get("file://" + os.path.abspath(path))
+        for locator, (micros, count) in zip(locators, driver.execute_script(TIMING_SCRIPT, payload,
+                                                                            iterations)):
+            per_locator[locator_key(locator)].append(micros)
+            matches[locator_key(locator)] += count
+    return {key: (max(samples) if samples else None, matches[key])
+            for key, samples in per_locator.items()}
+
+
+def time_with_new_browser(locators, browser="chrome"):
+    """Launch a throwaway browser for timing; None when no browser can be started"""
+    from utilities.driver_factory import create_driver
+    try:
+        driver = create_driver(browser, "fast")
+    except Exception as e:
+        print(f"Selector timing skipped - no browser: {e}")
+        return None
+    try:
+        return time_locators(driver, locators)
+    finally:
+        driver.quit()
+
+
+# ============ SNAPSHOTS ============
+
+def save_snapshots(base_url=None, snapshot_dir=SNAPSHOT_DIR):
+    """Fetch the pages the page objects work on and store them as HTML snapshots"""
+    import requests
+    from pages.bill_pay_page import BillPayPage
+    from test_data.test_data import TestData
+    from utilities.stub_server import StubServer
+    from utilities.user_provisioning import REGISTER_FORM_FIELDS
+
+    server = None
+    if base_url is None:
+        server = StubServer().start()
+        base_url = server.base_url
+    base_url = base_url.rstrip("/")
+    pages = {}
+    try:
+        with requests.Session() as session:
+            pages["index"] = session.get(f"{base_url}/index.htm").text
+            pages["register"] = session.get(f"{base_url}/register.htm").text
+            pages["register_errors"] = session.post(f"{base_url}/register.htm", data={}).text
+
+            user = TestData.get_valid_user_data()
+            form = {field: user[key] for key, field in REGISTER_FORM_FIELDS.items()}
+            form["repeatedPassword"] = user["password"]
+            pages["register_success"] = session.post(f"{base_url}/register.htm", data=form).text
+
+            pages["billpay"] = session.get(f"{base_url}/billpay.htm").text
+            bill = TestData.get_valid_bill_pay_data()
+            payment = {
+                BillPayPage.PAYEE_NAME[1]: bill["payee_name"],
+                BillPayPage.PAYEE_ADDRESS[1]: bill["payee_address"],
+                BillPayPage.PAYEE_CITY[1]: bill["payee_city"],
+                BillPayPage.PAYEE_STATE[1]: bill["payee_state"],
+                BillPayPage.PAYEE_ZIP_CODE[1]: bill["payee_zip"],
+                BillPayPage.PAYEE_PHONE[1]: bill["payee_phone"],
+                BillPayPage.PAYEE_ACCOUNT[1]: bill["payee_account"],
+                BillPayPage.VERIFY_ACCOUNT[1]: bill["payee_account"],
+                BillPayPage.AMOUNT[1]: bill["amount"],
+            }
+            pages["billpay_result"] = session.post(f"{base_url}/billpay.htm", data=payment).text
+    finally:
+        if server is not None:
+            server.stop()
+
+    os.makedirs(snapshot_dir, exist_ok=True)
+    for name, text in pages.items():
+        with open(os.path.join(snapshot_dir, f"{name}.html"), "w", encoding="utf-8") as f:
+            f.write(text)
+    return sorted(pages)
+
+
+# ============ BASELINE AND REPORT ============
+
+def load_baseline(path=BASELINE_PATH):
+    try:
+        with open(path) as f:
+            return set(json.load(f))
+    except (OSError, ValueError):
+        return set()
+
+
+def is_violation(finding, threshold_us=DEFAULT_THRESHOLD_US):
+    slow = finding.timing_us is not None and finding.timing_us > threshold_us
+    return finding.full_scan or slow
+
+
+def violations(findings, baseline, threshold_us=DEFAULT_THRESHOLD_US):
+    """Findings for locators that are not in the baseline and scan the document or are slow"""
+    return [finding for finding in findings
+            if locator_key(finding.locator) not in baseline and is_violation(finding, threshold_us)]
+
+
+def format_suggestion(suggestion):
+    if not suggestion:
+        return ""
+    by, value, *note = suggestion
+    text = f"(By.{next(name for name, v in BY_VALUES.items() if v == by)}, {value!r})"
+    return f"{text} + {note[0]}" if note else text
+
+
+def format_finding(finding):
+    locator = finding.locator
+    line = f"{locator.path}:{locator.line} {locator.owner} ({locator.by}) {locator.value!r}"
+    if finding.timing_us is not None:
+        line += f"  {finding.timing_us:.1f} us/lookup, {finding.matches} matches"
+    if finding.full_scan:
+        line += f"\n    full-document scan: {finding.reason}"
+    if finding.suggestion:
+        line += f"\n    suggest: {format_suggestion(finding.suggestion)}"
+    return line
+
+
+def lint(browser=None):
+    """Scan, optionally time in a new browser, and analyze every page-object locator"""
+    locators = scan_locators()
+    timings = time_with_new_browser(locators, browser) if browser else None
+    return analyze(locators, timings=timings)
+
+
+# ============ PYTEST PLUGIN ============
+
+def pytest_addoption(parser):
+    group = parser.getgroup("selector lint", "page-object locator performance")
+    group.addoption("--lint-selectors", action="store_true", default=False,
+                    help="Fail when a locator not in the baseline scans the document or is slow")
+    group.addoption("--selector-threshold-us", action="store", type=float,
+                    default=DEFAULT_THRESHOLD_US,
+                    help="Slowest allowed in-browser lookup per locator in microseconds")
+    group.addoption("--selector-baseline", action="store", default=BASELINE_PATH,
+                    help="Accepted locators (python -m utilities.selector_lint --update-baseline)")
+
+
+class SelectorLintPlugin:
+    def __init__(self, config):
+        self.config = config
+        self.violations = []
+
+    def pytest_sessionstart(self, session):
+        findings = lint(browser=self.config.getoption("--browser", "chrome"))
+        self.violations = violations(findings, load_baseline(self.config.getoption("--selector-baseline")),
+                                     self.config.getoption("--selector-threshold-us"))
+
+    def pytest_sessionfinish(self, session, exitstatus):
+        if self.violations and session.exitstatus == pytest.ExitCode.OK:
+            session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.violations:
+            terminalreporter.write_sep("-", f"{len(self.violations)} slow or scanning locators")
+            for finding in self.violations:
+                terminalreporter.write_line(format_finding(finding))
+
+
+def pytest_configure(config):
+    # Lint once per run, in the controller
+    if config.getoption("--lint-selectors") and not hasattr(config, "workerinput"):
+        config.pluginmanager.register(SelectorLintPlugin(config), "parabank_selector_lint")
+
+
+# ============ COMMAND LINE ============
+
+def main():
+    parser = argparse.ArgumentParser(description="Selector performance linter for pages/")
+    parser.add_argument("--time", action="store_true", help="Time every locator in a browser")
+    parser.add_argument("--browser", default="chrome")
+    parser.add_argument("--threshold-us", type=float, default=DEFAULT_THRESHOLD_US)
+    parser.add_argument("--save-snapshots", action="store_true",
+                        help="Refresh test_data/page_snapshots from the local stub (or --base-url)")
+    parser.add_argument("--base-url", default=None)
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Accept every current finding in the baseline")
+    args = parser.parse_args()
+
+    if args.save_snapshots:
+        names = save_snapshots(args.base_url)
+        print(f"Saved {len(names)} snapshots to {SNAPSHOT_DIR}: {', '.join(names)}")
+        return 0
+
+    findings = lint(browser=args.browser if args.time else None)
+    flagged = [finding for finding in findings if is_violation(finding, args.threshold_us)]
+    for finding in findings:
+        if finding in flagged or finding.timing_us is not None:
+            print(format_finding(finding))
+
+    if args.update_baseline:
+        write_json(BASELINE_PATH, sorted(locator_key(finding.locator) for finding in flagged))
+        print(f"Baseline updated with {len(flagged)} locators: {BASELINE_PATH}")
+        return 0
+
+    new = violations(findings, load_baseline(), args.threshold_us)
+    timed = [finding.timing_us for finding in findings if finding.timing_us is not None]
+    median = f", median {statistics.median(timed):.1f} us/lookup" if timed else ""
+    print(f"{len(findings)} locators, {len(flagged)} flagged, {len(new)} not in baseline{median}")
+    return 1 if new else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
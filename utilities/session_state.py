@@ -0,0 +1,169 @@
+"""
+Browser session snapshots - cookies plus local/session storage - keyed by scenario
+
+After an expensive setup flow (registering or logging a user in), capture
+the browser state once; later tests restore it into a fresh or recycled
+driver instead of repeating the flow:
+
+    states = SessionStateStore()
+    state = states.load("bill_pay_gw0")
+    if state is None or not states.restore(driver, state, url=billpay_url):
+        ...log in the slow way...
+        states.capture(driver, "bill_pay_gw0", username=username)
+
+Snapshots live in .session_state/ as JSON, one file per scenario and base
+URL, and expire after max_age seconds (server sessions time out too).
+"""
+
+import hashlib
+import json
+import os
+import time
+from urllib.parse import urlparse
+
+from selenium.common.exceptions import WebDriverException
+
+from utilities.instrumentation import safe_file_name, write_json
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_STATE_DIR = os.path.join(PROJECT_ROOT, ".session_state")
+
+CAPTURE_STORAGE_SCRIPT = """
+function dump(storage) {
+    var items = {};
+    for (var i = 0; i < storage.length; i++) {
+        var key = storage.key(i);
+        items[key] = storage.getItem(key);
+    }
+    return items;
+}
+try {
+    return {origin: location.origin, local: dump(localStorage), session: dump(sessionStorage)};
+} catch (e) {
+    return {origin: location.origin, local: {}, session: {}};
+}
+"""
+
+# Runs with the state as arguments[0] (fallback path) or inlined into a new-document script (CDP)
+RESTORE_STORAGE_SCRIPT = """
+(function (state) {
+    if (location.origin !== state.origin) return;
+    Object.keys(state.local).forEach(function (key) { localStorage.setItem(key, state.local[key]); });
+    Object.keys(state.session).forEach(function (key) { sessionStorage.setItem(key, state.session[key]); });
+})(%s);
+"""
+
+
+def _origin(url):
+    parts = urlparse(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+class SessionStateStore:
+    """Captures, persists and restores browser session state"""
+
+    def __init__(self, directory=DEFAULT_STATE_DIR, max_age=30 * 60):
+        self.directory = directory
+        self.max_age = max_age
+        self.restored = 0
+        self.captured = 0
+
+    def path(self, scenario, base_url):
+        # The same scenario against the stub and the real site must not share a session
+        origin_key = hashlib.sha1(base_url.encode()).hexdigest()[:8]
+        return os.path.join(self.directory, f"{safe_file_name(scenario)}-{origin_key}.json")
+
+    def capture(self, driver, scenario, **metadata):
+        """Snapshot cookies and storage of the driver's current origin and save them"""
+        url = driver.current_url
+        storage = driver.execute_script(CAPTURE_STORAGE_SCRIPT)
+        state = {
+            'scenario': scenario,
+            'url': url,
+            'origin': storage['origin'],
+            'cookies': driver.get_cookies(),
+            'local_storage': storage['local'],
+            'session_storage': storage['session'],
+            'created_at': time.time(),
+            'metadata': metadata,
+        }
+        write_json(self.path(scenario, _origin(url)), state)
+        self.captured += 1
+        return state
+
+    def load(self, scenario, base_url):
+        """The saved state for the scenario, or None if missing or older than max_age"""
+        path = self.path(scenario, _origin(base_url))
+        try:
+            with open(path) as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if time.time() - state['created_at'] > self.max_age:
+            self.discard(scenario, base_url)
+            return None
+        return state
+
+    def discard(self, scenario, base_url):
+        try:
+            os.remove(self.path(scenario, _origin(base_url)))
+        except OSError:
+            pass
+
+    def restore(self, driver, state, url=None):
+        """Put the state into the driver, then open url (default: the captured page)
+
+        Chrome gets cookies and storage through CDP without an extra page load;
+        other browsers visit the origin first. Returns False if the driver
+        rejected the state.
+        """
+        url = url or state['url']
+        has_storage = bool(state['local_storage'] or state['session_storage'])
+        try:
+            if hasattr(driver, "execute_cdp_cmd"):
+                self._restore_via_cdp(driver, state, url, has_storage)
+            else:
+                self._restore_via_origin(driver, state, url, has_storage)
+        except WebDriverException as e:
+            print(f"Could not restore session state '{state['scenario']}': {e}")
+            return False
+        self.restored += 1
+        return True
+
+    def _storage_payload(self, state):
+        return {'origin': state['origin'], 'local': state['local_storage'],
+                'session': state['session_storage']}
+
+    def _restore_via_cdp(self, driver, state, url, has_storage):
+        cookies = []
+        for cookie in state['cookies']:
+            cdp_cookie = {key: cookie[key] for key in ('name', 'value', 'path', 'domain', 'secure', 'httpOnly')
+                          if key in cookie}
+            if 'expiry' in cookie:
+                cdp_cookie['expires'] = cookie['expiry']
+            if 'domain' not in cookie:
+                cdp_cookie['url'] = state['origin']
+            cookies.append(cdp_cookie)
+        driver.execute_cdp_cmd("Network.setCookies", {'cookies': cookies})
+
+        if not has_storage:
+            driver.get(url)
+            return
+        # Storage is per origin, so it is written by a script that runs before the page's own
+        script = RESTORE_STORAGE_SCRIPT % json.dumps(self._storage_payload(state))
+        identifier = driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {'source': script})
+        try:
+            driver.get(url)
+        finally:
+            # One-shot: later navigations in a pooled browser must not get the state again
+            driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument",
+                                   {'identifier': identifier['identifier']})
+
+    def _restore_via_origin(self, driver, state, url, has_storage):
+        # Cookies and storage can only be written for the page that is open
+        driver.get(state['url'])
+        for cookie in state['cookies']:
+            driver.add_cookie(cookie)
+        if has_storage:
+            driver.execute_script(RESTORE_STORAGE_SCRIPT % "arguments[0]", self._storage_payload(state))
+        driver.get(url)
@@ -0,0 +1,206 @@
+"""
+Process-wide settings loaded once from config.ini
+
+Values are merged in this order, later ones winning:
+
+    config.ini  <  PARABANK_* environment variables  <  configure(**overrides)
+
+get_settings() returns the same frozen Settings object until configure()
+or reload() is called. In watch mode (watch(True) or PARABANK_CONFIG_WATCH=1)
+it re-reads config.ini when the file's mtime changes.
+"""
+
+import configparser
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import Optional, Tuple
+
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "config.ini")
+
+# Environment variable -> Settings field; xdist workers and child processes inherit these
+ENV_OVERRIDES = {
+    "PARABANK_BASE_URL": "base_url",
+    "PARABANK_TIMEOUT": "timeout",
+    "PARABANK_BROWSER_PROFILE": "browser_profile",
+    "PARABANK_USER_POOL_MIN_SIZE": "user_pool_min_size",
+    "PARABANK_USER_POOL_REFILL_SIZE": "user_pool_refill_size",
+}
+
+
+class ConfigError(ValueError):
+    """A value in config.ini or an override cannot be converted to its setting type"""
+
+
+@dataclass(frozen=True)
+class Settings:
+    base_url: str = "https://parabank.parasoft.com/parabank"
+    timeout: int = 10
+    browser_profile: str = "fast"
+    blocked_hosts: Tuple[str, ...] = ()
+    driver_offline: bool = False
+    chrome_driver_path: str = ""
+    firefox_driver_path: str = ""
+    seeded_users: Tuple[Tuple[str, str], ...] = ()
+    user_pool_enabled: bool = True
+    user_pool_min_size: int = 5
+    user_pool_refill_size: int = 10
+    stub_delay_ms: int = 0
+    artifacts_max_mb: int = 200
+    artifacts_image_format: str = "webp"
+    artifacts_quality: int = 60
+    health_probe_timeout: int = 5
+    health_breaker_threshold: int = 3
+    session_state_enabled: bool = True
+    session_state_max_age: int = 1800
+    source: Optional[str] = field(default=None, compare=False)
+
+    def driver_path(self, browser):
+        """Pinned driver binary for the browser from [driver], "" when none is set"""
+        return getattr(self, f"{browser}_driver_path", "")
+
+
+# Settings field -> (section, key) in config.ini
+INI_KEYS = {
+    "base_url": ("application", "base_url"),
+    "timeout": ("application", "timeout"),
+    "browser_profile": ("browser", "profile"),
+    "blocked_hosts": ("browser", "blocked_hosts"),
+    "driver_offline": ("driver", "offline"),
+    "chrome_driver_path": ("driver", "chrome_driver_path"),
+    "firefox_driver_path": ("driver", "firefox_driver_path"),
+    "seeded_users": ("provisioning", "seeded_users"),
+    "user_pool_enabled": ("user_pool", "enabled"),
+    "user_pool_min_size": ("user_pool", "min_size"),
+    "user_pool_refill_size": ("user_pool", "refill_size"),
+    "stub_delay_ms": ("stub", "delay_ms"),
+    "artifacts_max_mb": ("artifacts", "max_mb"),
+    "artifacts_image_format": ("artifacts", "image_format"),
+    "artifacts_quality": ("artifacts", "quality"),
+    "health_probe_timeout": ("health", "probe_timeout"),
+    "health_breaker_threshold": ("health", "breaker_threshold"),
+    "session_state_enabled": ("session_state", "enabled"),
+    "session_state_max_age": ("session_state", "max_age"),
+}
+
+_TRUE = {"1", "yes", "true", "on"}
+_FALSE = {"0", "no", "false", "off"}
+
+
+def _parse_hosts(raw):
+    return tuple(host.strip() for host in raw.split(",") if host.strip())
+
+
+def _parse_users(raw):
+    """Comma separated 'username:password' pairs"""
+    users = []
+    for entry in raw.split(","):
+        if ":" in entry:
+            username, password = entry.strip().split(":", 1)
+            users.append((username, password))
+    return tuple(users)
+
+
+def _convert(name, raw, origin):
+    """Convert a raw string to the type of the Settings field `name`"""
+    default = Settings.__dataclass_fields__[name].default
+    value = raw.strip()
+    if name == "blocked_hosts":
+        return _parse_hosts(value)
+    if name == "seeded_users":
+        return _parse_users(value)
+    if isinstance(default, bool):
+        if value.lower() in _TRUE:
+            return True
+        if value.lower() in _FALSE:
+            return False
+        raise ConfigError(f"{origin}: expected a boolean, got {raw!r}")
+    if isinstance(default, int):
+        try:
+            return int(value)
+        except ValueError:
+            raise ConfigError(f"{origin}: expected an integer, got {raw!r}") from None
+    return value
+
+
+def load_settings(path=CONFIG_PATH, environ=None, overrides=None):
+    """Build Settings from config.ini, the environment and explicit overrides
+
+    Missing sections or keys fall back to the defaults; malformed values raise ConfigError.
+    """
+    environ = os.environ if environ is None else environ
+    values = {}
+
+    parser = configparser.ConfigParser()
+    if os.path.exists(path):
+        parser.read(path)
+    for name, (section, key) in INI_KEYS.items():
+        raw = parser.get(section, key, fallback=None)
+        if raw is None or not raw.strip():
+            continue
+        values[name] = _convert(name, raw, f"[{section}] {key} in {path}")
+
+    for variable, name in ENV_OVERRIDES.items():
+        if environ.get(variable):
+            values[name] = _convert(name, environ[variable], variable)
+
+    for name, value in (overrides or {}).items():
+        if name not in Settings.__dataclass_fields__:
+            raise ConfigError(f"Unknown setting {name!r}")
+        if value is not None:
+            values[name] = _convert(name, value, f"override {name}") if isinstance(value, str) else value
+
+    return Settings(source=path if os.path.exists(path) else None, **values)
+
+
+# ============ PROCESS-WIDE CACHE ============
+
+_lock = threading.Lock()
+_settings = None
+_mtime = None
+_overrides = {}
+_watch = os.environ.get("PARABANK_CONFIG_WATCH", "").lower() in _TRUE
+
+
+def _file_mtime():
+    try:
+        return os.stat(CONFIG_PATH).st_mtime_ns
+    except OSError:
+        return None
+
+
+def get_settings():
+    """The cached Settings for this process; loaded on first use"""
+    settings = _settings
+    if settings is not None and not (_watch and _file_mtime() != _mtime):
+        return settings
+    return reload()
+
+
+def reload():
+    """Re-read config.ini and the environment, keeping configure() overrides"""
+    global _settings, _mtime
+    with _lock:
+        _mtime = _file_mtime()
+        _settings = load_settings(overrides=_overrides)
+        return _settings
+
+
+def configure(**overrides):
+    """Apply overrides (e.g. from the pytest command line) on top of file and environment"""
+    _overrides.update({name: value for name, value in overrides.items() if value is not None})
+    return reload()
+
+
+def reset():
+    """Drop all overrides and the cached settings"""
+    global _settings
+    with _lock:
+        _overrides.clear()
+        _settings = None
+
+
+def watch(enabled=True):
+    """Re-read config.ini whenever it changes on disk (for long-lived interactive sessions)"""
+    global _watch
+    _watch = enabled
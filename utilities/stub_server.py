@@ -0,0 +1,375 @@
+"""
+Local ParaBank stand-in server
+
+Serves index.htm, register.htm, login.htm, billpay.htm, overview.htm and
+logout.htm with the same form field names as the real application, so the
+page objects run unchanged against it. Run standalone with:
+
+    python -m utilities.stub_server --port 8080 --delay-ms 50
+"""
+
+import argparse
+import html
+import os
+import random
+import secrets
+import sys
+import threading
+import time
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from string import Template
+from urllib.parse import parse_qs, urlparse
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+PAGES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "stub_pages")
+CONTEXT_PATH = "/parabank"
+SESSION_COOKIE = "JSESSIONID"
+
+# Field name -> message, in the order ParaBank validates them
+REGISTER_REQUIRED_FIELDS = [
+    ("customer.firstName", "First name is required."),
+    ("customer.lastName", "Last name is required."),
+    ("customer.address.street", "Address is required."),
+    ("customer.address.city", "City is required."),
+    ("customer.address.state", "State is required."),
+    ("customer.address.zipCode", "Zip Code is required."),
+    ("customer.ssn", "Social Security Number is required."),
+    ("customer.username", "Username is required."),
+    ("customer.password", "Password is required."),
+    ("repeatedPassword", "Password confirmation is required."),
+]
+REGISTER_FIELDS = [name for name, _ in REGISTER_REQUIRED_FIELDS] + ["customer.phoneNumber"]
+
+BILLPAY_REQUIRED_FIELDS = [
+    ("payee.name", "Payee name is required."),
+    ("payee.address.street", "Address is required."),
+    ("payee.address.city", "City is required."),
+    ("payee.address.state", "State is required."),
+    ("payee.address.zipCode", "Zip Code is required."),
+    ("payee.phoneNumber", "Phone number is required."),
+    ("payee.accountNumber", "Account number is required."),
+    ("verifyAccount", "Account number is required."),
+    ("amount", "The amount cannot be empty."),
+]
+BILLPAY_FIELDS = [name for name, _ in BILLPAY_REQUIRED_FIELDS]
+
+
+def _load_template(name):
+    with open(os.path.join(PAGES_DIR, f"{name}.html"), encoding="utf-8") as f:
+        return Template(f.read())
+
+
+def _placeholder(field_name):
+    """Template identifier for a dotted form field name"""
+    return field_name.replace(".", "_")
+
+
+class StubState:
+    """In-memory users and sessions shared by all request handler threads"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.users = {}
+        self.sessions = {}
+        self._next_account = 13000 + random.randint(0, 999) * 100
+
+    def create_user(self, fields):
+        with self.lock:
+            self._next_account += 11
+            user = {
+                'username': fields["customer.username"],
+                'password': fields["customer.password"],
+                'full_name': f'{fields["customer.firstName"]} {fields["customer.lastName"]}',
+                'accounts': {str(self._next_account): 515.50},
+            }
+            self.users[user['username']] = user
+            return user
+
+    def start_session(self, username):
+        session_id = secrets.token_hex(16).upper()
+        with self.lock:
+            self.sessions[session_id] = username
+        return session_id
+
+
+class StubRequestHandler(BaseHTTPRequestHandler):
+    """Routes ParaBank page requests to the in-memory state"""
+
+    server_version = "ParaBankStub/1.0"
+    templates = {}
+
+    def log_message(self, format, *args):
+        # Keep pytest output clean
+        pass
+
+    # ============ HTTP PLUMBING ============
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def _dispatch(self, method):
+        if self.server.response_delay:
+            time.sleep(self.server.response_delay)
+
+        path = urlparse(self.path).path
+        if path in ("", "/", CONTEXT_PATH, CONTEXT_PATH + "/"):
+            page = "index.htm"
+        elif path.startswith(CONTEXT_PATH + "/"):
+            page = path[len(CONTEXT_PATH) + 1:]
+        else:
+            self._send(404, self._render_error("The requested page does not exist."))
+            return
+
+        self._new_session_id = None
+        routes = {
+            "index.htm": self._index,
+            "register.htm": self._register,
+            "login.htm": self._login,
+            "logout.htm": self._logout,
+            "overview.htm": self._overview,
+            "billpay.htm": self._billpay,
+        }
+        handler = routes.get(page)
+        if handler is None:
+            self._send(404, self._render_error("The requested page does not exist."))
+            return
+        handler(method)
+
+    def _form(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length).decode("utf-8")
+        parsed = parse_qs(body, keep_blank_values=True)
+        return {key: values[0].strip() for key, values in parsed.items()}
+
+    def _session_id(self):
+        cookie = SimpleCookie(self.headers.get("Cookie", ""))
+        if SESSION_COOKIE in cookie:
+            return cookie[SESSION_COOKIE].value
+        return None
+
+    def _current_user(self):
+        state = self.server.state
+        with state.lock:
+            username = state.sessions.get(self._session_id())
+            return state.users.get(username)
+
+    def _send(self, status, body, location=None):
+        payload = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html;charset=UTF-8")
+        self.send_header("Content-Length", str(len(payload)))
+        if location:
+            self.send_header("Location", location)
+        if self._new_session_id:
+            self.send_header("Set-Cookie",
+                             f"{SESSION_COOKIE}={self._new_session_id}; Path={CONTEXT_PATH}; HttpOnly")
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _redirect(self, page):
+        self._send(302, "", location=f"{CONTEXT_PATH}/{page}")
+
+    # ============ RENDERING ============
+
+    @classmethod
+    def _template(cls, name):
+        if name not in cls.templates:
+            cls.templates[name] = _load_template(name)
+        return cls.templates[name]
+
+    def _render(self, title, content, user=None):
+        if user:
+            left_panel = self._template("account_panel").substitute(
+                full_name=html.escape(user['full_name']))
+        else:
+            left_panel = self._template("login_panel").template
+        return self._template("layout").substitute(
+            title=title, left_panel=left_panel, content=content)
+
+    def _render_error(self, message, user=None):
+        content = self._template("error").substitute(message=html.escape(message))
+        return self._render("Error", content, user)
+
+    def _render_form(self, field_names, values, errors):
+        mapping = {}
+        for name in field_names:
+            mapping[f"value_{_placeholder(name)}"] = html.escape(values.get(name, ""))
+            mapping[f"error_{_placeholder(name)}"] = html.escape(errors.get(name, ""))
+        return mapping
+
+    # ============ PAGES ============
+
+    def _index(self, method):
+        self._send(200, self._render("Welcome | Online Banking",
+                                     self._template("index").template, self._current_user()))
+
+    def _register(self, method):
+        if method == "GET":
+            self._send(200, self._render_register({}, {}))
+            return
+
+        form = self._form()
+        errors = {}
+        for name, message in REGISTER_REQUIRED_FIELDS:
+            if not form.get(name):
+                errors[name] = message
+        if "customer.password" not in errors and "repeatedPassword" not in errors \
+                and form["customer.password"] != form["repeatedPassword"]:
+            errors["repeatedPassword"] = "Passwords did not match."
+        if "customer.username" not in errors and form["customer.username"] in self.server.state.users:
+            errors["customer.username"] = "This username already exists."
+
+        if errors:
+            self._send(200, self._render_register(form, errors))
+            return
+
+        user = self.server.state.create_user(form)
+        self._new_session_id = self.server.state.start_session(user['username'])
+        content = self._template("register_success").substitute(
+            username=html.escape(user['username']))
+        self._send(200, self._render("Customer Created", content, user))
+
+    def _render_register(self, values, errors):
+        content = self._template("register").substitute(
+            self._render_form(REGISTER_FIELDS, values, errors))
+        return self._render("Register for Free Online Account Access", content)
+
+    def _login(self, method):
+        if method == "GET":
+            self._index(method)
+            return
+
+        form = self._form()
+        state = self.server.state
+        with state.lock:
+            user = state.users.get(form.get("username", ""))
+        if not user or user['password'] != form.get("password", ""):
+            self._send(200, self._render_error("The username and password could not be verified."))
+            return
+
+        self._new_session_id = state.start_session(user['username'])
+        self._send(200, self._render_overview(user))
+
+    def _logout(self, method):
+        state = self.server.state
+        with state.lock:
+            state.sessions.pop(self._session_id(), None)
+        self._redirect("index.htm")
+
+    def _overview(self, method):
+        user = self._current_user()
+        if not user:
+            self._send(200, self._render_error("An internal error has occurred and has been logged."))
+            return
+        self._send(200, self._render_overview(user))
+
+    def _render_overview(self, user):
+        rows = "\n".join(
+            f'            <tr><td><a href="activity.htm?id={account}">{account}</a></td>'
+            f'<td>${balance:.2f}</td><td>${balance:.2f}</td></tr>'
+            for account, balance in user['accounts'].items())
+        content = self._template("overview").substitute(account_rows=rows)
+        return self._render("Accounts Overview", content, user)
+
+    def _billpay(self, method):
+        user = self._current_user()
+        if not user:
+            self._send(200, self._render_error("An internal error has occurred and has been logged."))
+            return
+
+        if method == "GET":
+            self._send(200, self._render_billpay(user, {}, {}))
+            return
+
+        form = self._form()
+        errors = {}
+        for name, message in BILLPAY_REQUIRED_FIELDS:
+            if not form.get(name):
+                errors[name] = message
+        if "amount" not in errors:
+            try:
+                float(form["amount"])
+            except ValueError:
+                errors["amount"] = "Please enter a valid amount."
+        if "payee.accountNumber" not in errors and not form["payee.accountNumber"].isdigit():
+            errors["payee.accountNumber"] = "Please enter a valid number."
+        if "verifyAccount" not in errors and "payee.accountNumber" not in errors \
+                and form["verifyAccount"] != form["payee.accountNumber"]:
+            errors["verifyAccount"] = "The account numbers do not match."
+
+        if errors:
+            self._send(200, self._render_billpay(user, form, errors))
+            return
+
+        from_account = form.get("fromAccountId") or next(iter(user['accounts']))
+        content = self._template("billpay_result").substitute(
+            payee_name=html.escape(form["payee.name"]),
+            amount=html.escape(form["amount"]),
+            from_account=html.escape(from_account))
+        self._send(200, self._render("Bill Pay", content, user))
+
+    def _render_billpay(self, user, values, errors):
+        mapping = self._render_form(BILLPAY_FIELDS, values, errors)
+        mapping["account_options"] = "".join(
+            f'<option value="{account}">{account}</option>' for account in user['accounts'])
+        content = self._template("billpay").substitute(mapping)
+        return self._render("Bill Pay", content, user)
+
+
+class StubServer:
+    """Runs the ParaBank stub on a background thread"""
+
+    def __init__(self, host="127.0.0.1", port=0, delay_ms=0):
+        self.httpd = ThreadingHTTPServer((host, port), StubRequestHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.state = StubState()
+        self.httpd.response_delay = delay_ms / 1000.0
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}{CONTEXT_PATH}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local ParaBank stand-in server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--delay-ms", type=int, default=0, help="Delay added to every response")
+    args = parser.parse_args()
+
+    server = StubServer(args.host, args.port, args.delay_ms)
+    print(f"ParaBank stub listening on {server.base_url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
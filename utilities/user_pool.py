@@ -0,0 +1,204 @@
+"""
+Registered-user pool persisted in SQLite across runs
+
+Tests lease a user, get a fresh logged-in session from a cheap login probe
+and give the user back afterwards. New users are only registered when the
+pool runs low, on a background thread, so registration stops being a
+per-test cost.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+
+from test_data.test_data import TestData
+from utilities.user_provisioning import ProvisioningError
+
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_POOL_PATH = os.path.join(PROJECT_ROOT, "test_data", "user_pool.db")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    username TEXT NOT NULL,
+    base_url TEXT NOT NULL,
+    password TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_checked REAL,
+    healthy INTEGER NOT NULL DEFAULT 1,
+    leased_by TEXT,
+    leased_at REAL,
+    PRIMARY KEY (username, base_url)
+)
+"""
+
+
+class UserPool:
+    """Leases healthy users from the pool file and refills it when it runs low"""
+
+    def __init__(self, provisioner, path=DEFAULT_POOL_PATH, min_size=5, refill_size=10,
+                 lease_timeout=30 * 60):
+        self.provisioner = provisioner
+        self.base_url = provisioner.base_url
+        self.path = path
+        self.min_size = min_size
+        self.refill_size = refill_size
+        self.lease_timeout = lease_timeout
+        self.owner = f"{os.environ.get('PYTEST_XDIST_WORKER', 'main')}:{os.getpid()}"
+        self._refill_thread = None
+        self._refill_lock = threading.Lock()
+
+        with self._connect() as connection:
+            connection.execute(SCHEMA)
+
+    def _connect(self):
+        # One short-lived connection per operation keeps this safe across threads and workers
+        connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        return _Transaction(connection)
+
+    # ============ LEASING ============
+
+    def lease(self):
+        """Lease a user and return it logged in (ProvisionedUser with fresh cookies)"""
+        while True:
+            username, password = self._claim()
+            if username is None:
+                # Pool is empty - register one now rather than waiting for a refill
+                user = self.provisioner.register(TestData.get_valid_user_data())
+                self.add(user.username, user.password, leased=True)
+                self._refill_if_low()
+                return user
+
+            try:
+                user = self.provisioner.login(username, password)
+            except ProvisioningError as e:
+                print(f"Pooled user '{username}' failed its login probe: {e}")
+                self._mark_unhealthy(username)
+                continue
+
+            self._mark_checked(username)
+            self._refill_if_low()
+            return user
+
+    def claim(self, username):
+        """Lease one specific user, or renew this process's lease on it; False if someone else holds it
+
+        Unlike lease() there is no login probe - callers already have a session for the user.
+        """
+        now = time.time()
+        with self._connect() as connection:
+            cursor = connection.execute(
+                "UPDATE users SET leased_by = ?, leased_at = ? "
+                "WHERE username = ? AND base_url = ? AND healthy = 1 "
+                "AND (leased_by IS NULL OR leased_by = ? OR leased_at < ?)",
+                (self.owner, now, username, self.base_url, self.owner, now - self.lease_timeout))
+            return cursor.rowcount == 1
+
+    def release(self, username):
+        with self._connect() as connection:
+            connection.execute(
+                "UPDATE users SET leased_by = NULL, leased_at = NULL "
+                "WHERE username = ? AND base_url = ? AND leased_by = ?",
+                (username, self.base_url, self.owner))
+
+    def add(self, username, password, leased=False):
+        now = time.time()
+        with self._connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO users "
+                "(username, base_url, password, created_at, last_checked, healthy, leased_by, leased_at) "
+                "VALUES (?, ?, ?, ?, ?, 1, ?, ?)",
+                (username, self.base_url, password, now, now,
+                 self.owner if leased else None, now if leased else None))
+
+    def available_count(self):
+        with self._connect() as connection:
+            return connection.execute(
+                "SELECT COUNT(*) FROM users WHERE base_url = ? AND healthy = 1 "
+                "AND (leased_by IS NULL OR leased_at < ?)",
+                (self.base_url, time.time() - self.lease_timeout)).fetchone()[0]
+
+    def _claim(self):
+        """Atomically mark one free (or abandoned) healthy user as leased by this process"""
+        now = time.time()
+        with self._connect() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            row = connection.execute(
+                "SELECT username, password FROM users WHERE base_url = ? AND healthy = 1 "
+                "AND (leased_by IS NULL OR leased_at < ?) ORDER BY last_checked DESC LIMIT 1",
+                (self.base_url, now - self.lease_timeout)).fetchone()
+            if row is None:
+                return None, None
+            connection.execute(
+                "UPDATE users SET leased_by = ?, leased_at = ? WHERE username = ? AND base_url = ?",
+                (self.owner, now, row[0], self.base_url))
+            return row
+
+    def _mark_checked(self, username):
+        with self._connect() as connection:
+            connection.execute(
+                "UPDATE users SET last_checked = ? WHERE username = ? AND base_url = ?",
+                (time.time(), username, self.base_url))
+
+    def _mark_unhealthy(self, username):
+        with self._connect() as connection:
+            connection.execute(
+                "UPDATE users SET healthy = 0, leased_by = NULL, leased_at = NULL "
+                "WHERE username = ? AND base_url = ?",
+                (username, self.base_url))
+
+    # ============ REFILLING ============
+
+    def _refill_if_low(self):
+        if self.available_count() >= self.min_size:
+            return
+        with self._refill_lock:
+            if self._refill_thread is not None and self._refill_thread.is_alive():
+                return
+            self._refill_thread = threading.Thread(target=self.refill, name="user-pool-refill",
+                                                   daemon=True)
+            self._refill_thread.start()
+
+    def refill(self, count=None):
+        """Register users until the pool holds refill_size free users (or count new ones)"""
+        missing = count if count is not None else self.refill_size - self.available_count()
+        for _ in range(max(0, missing)):
+            try:
+                user = self.provisioner.register(TestData.get_valid_user_data())
+            except ProvisioningError as e:
+                print(f"User pool refill stopped: {e}")
+                return
+            self.add(user.username, user.password)
+        self.purge_unhealthy()
+
+    def purge_unhealthy(self):
+        with self._connect() as connection:
+            connection.execute("DELETE FROM users WHERE base_url = ? AND healthy = 0", (self.base_url,))
+
+    def wait_for_refill(self, timeout=60):
+        if self._refill_thread is not None:
+            self._refill_thread.join(timeout)
+
+
+class _Transaction:
+    """Context manager that closes the connection and commits an open transaction"""
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    def execute(self, *args):
+        return self.connection.execute(*args)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if self.connection.in_transaction:
+                if exc_type is None:
+                    self.connection.commit()
+                else:
+                    self.connection.rollback()
+        finally:
+            self.connection.close()
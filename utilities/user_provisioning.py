@@ -0,0 +1,144 @@
+"""
+Creates ParaBank users over HTTP and hands their session to a WebDriver,
+so bill-pay tests can start logged in without driving the registration UI
+"""
+
+import itertools
+from collections import namedtuple
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from selenium.common.exceptions import WebDriverException
+
+from pages.register_page import RegisterPage
+from test_data.test_data import TestData
+from utilities.settings import get_settings
+
+
+ProvisionedUser = namedtuple("ProvisionedUser", ["username", "password", "cookies"])
+
+# TestData keys -> ParaBank form field names (IDs and names are identical on register.htm)
+REGISTER_FORM_FIELDS = {
+    'first_name': RegisterPage.FIRST_NAME_FIELD[1],
+    'last_name': RegisterPage.LAST_NAME_FIELD[1],
+    'address': RegisterPage.ADDRESS_FIELD[1],
+    'city': RegisterPage.CITY_FIELD[1],
+    'state': RegisterPage.STATE_FIELD[1],
+    'zip_code': RegisterPage.ZIP_CODE_FIELD[1],
+    'phone': RegisterPage.PHONE_FIELD[1],
+    'ssn': RegisterPage.SSN_FIELD[1],
+    'username': RegisterPage.USERNAME_FIELD[1],
+    'password': RegisterPage.PASSWORD_FIELD[1],
+}
+
+LOGGED_IN_MARKER = "Log Out"
+
+
+class ProvisioningError(Exception):
+    """Raised when a user could not be created or logged in over HTTP"""
+
+
+class UserProvisioner:
+    """Registers or logs in users over pooled HTTP connections"""
+
+    def __init__(self, base_url=None, pool_size=10, timeout=None, seeded_users=None):
+        settings = get_settings()
+        self.base_url = (base_url or settings.base_url).rstrip("/")
+        self.timeout = timeout or settings.timeout
+
+        # One adapter (and so one connection pool) shared by every per-user session
+        self._adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+
+        seeded = settings.seeded_users if seeded_users is None else seeded_users
+        self._seeded = itertools.cycle(seeded) if seeded else None
+
+    def url(self, page):
+        return f"{self.base_url}/{page}"
+
+    def provision(self):
+        """Return a logged-in user, from the seeded pool if configured, otherwise a new one"""
+        if self._seeded is not None:
+            username, password = next(self._seeded)
+            return self.login(username, password)
+        return self.register(TestData.get_valid_user_data())
+
+    def register(self, user_data):
+        """Register a new user through the register.htm form post"""
+        session = self._new_session()
+        payload = {field: user_data[key] for key, field in REGISTER_FORM_FIELDS.items()}
+        payload[RegisterPage.CONFIRM_PASSWORD_FIELD[1]] = user_data['password']
+
+        try:
+            # GET first so the server issues a session cookie for the post
+            session.get(self.url("register.htm"), timeout=self.timeout)
+            response = session.post(self.url("register.htm"), data=payload, timeout=self.timeout)
+        except requests.RequestException as e:
+            raise ProvisioningError(f"Registration request failed: {e}")
+
+        if response.status_code != 200 or LOGGED_IN_MARKER not in response.text:
+            raise ProvisioningError(
+                f"Registration of '{user_data['username']}' was rejected (HTTP {response.status_code})")
+
+        return ProvisionedUser(user_data['username'], user_data['password'], self._cookies(session))
+
+    def login(self, username, password):
+        """Log an existing user in through the login.htm form post"""
+        session = self._new_session()
+        try:
+            response = session.post(self.url("login.htm"),
+                                    data={'username': username, 'password': password},
+                                    timeout=self.timeout)
+        except requests.RequestException as e:
+            raise ProvisioningError(f"Login request failed: {e}")
+
+        if response.status_code != 200 or LOGGED_IN_MARKER not in response.text:
+            raise ProvisioningError(f"Login of '{username}' was rejected (HTTP {response.status_code})")
+
+        return ProvisionedUser(username, password, self._cookies(session))
+
+    def start_logged_in(self, driver, user, page="billpay.htm"):
+        """Inject the user's session cookies into the driver and open the given page"""
+        if not self._set_cookies_via_cdp(driver, user.cookies):
+            # Cookies can only be added for the current origin, so land there first
+            driver.get(self.url("index.htm"))
+            for cookie in user.cookies:
+                driver.add_cookie(cookie)
+        driver.get(self.url(page))
+
+    def session_for(self, user):
+        """A requests session on the shared connection pool carrying the user's login cookies"""
+        session = self._new_session()
+        for cookie in user.cookies:
+            session.cookies.set(cookie['name'], cookie['value'], path=cookie['path'])
+        return session
+
+    def close(self):
+        self._adapter.close()
+
+    def _new_session(self):
+        session = requests.Session()
+        session.mount("http://", self._adapter)
+        session.mount("https://", self._adapter)
+        return session
+
+    def _cookies(self, session):
+        default_path = urlparse(self.base_url).path or "/"
+        return [{'name': c.name, 'value': c.value, 'path': c.path or default_path}
+                for c in session.cookies]
+
+    def _set_cookies_via_cdp(self, driver, cookies):
+        """Chrome can set cookies for any origin without a page load"""
+        if not hasattr(driver, "execute_cdp_cmd"):
+            return False
+        try:
+            for cookie in cookies:
+                driver.execute_cdp_cmd("Network.setCookie", {
+                    'name': cookie['name'],
+                    'value': cookie['value'],
+                    'url': self.base_url,
+                    'path': cookie['path'],
+                })
+            return True
+        except WebDriverException:
+            return False
@@ -0,0 +1,88 @@
+"""
+Wait policy - the single owner of every timeout in the framework
+
+The implicit wait is switched off so negative lookups return instantly.
+Positive waits go through WaitPolicy.until, which supports per-call
+timeout overrides and records how long each page-object method spent
+waiting.
+"""
+
+import sys
+import threading
+import time
+from collections import defaultdict
+from selenium.webdriver.support.ui import WebDriverWait
+
+
+_stats_lock = threading.Lock()
+# "RegisterPage.register_user" -> [number of waits, total seconds]
+WAIT_STATS = defaultdict(lambda: [0, 0.0])
+
+
+def disable_implicit_wait(driver):
+    """Make find_element(s) return immediately; all waiting is explicit"""
+    driver.implicitly_wait(0)
+
+
+def _calling_page_method():
+    """Name of the outermost page-object method on the current call stack"""
+    frame = sys._getframe(2)
+    label = None
+    while frame is not None:
+        if frame.f_globals.get("__name__") == "utilities.instrumentation":
+            # Step-timer wrappers sit between nested page-object calls
+            frame = frame.f_back
+            continue
+        owner = frame.f_locals.get("self")
+        if owner is not None and hasattr(owner, "wait") and isinstance(owner.wait, WaitPolicy):
+            label = f"{type(owner).__name__}.{frame.f_code.co_name}"
+        elif label is not None:
+            break
+        frame = frame.f_back
+    return label or "unknown"
+
+
+def record_wait(label, seconds):
+    with _stats_lock:
+        entry = WAIT_STATS[label]
+        entry[0] += 1
+        entry[1] += seconds
+
+
+def wait_report(limit=10):
+    """Lines describing the page-object methods that spent the most time waiting"""
+    with _stats_lock:
+        ranked = sorted(WAIT_STATS.items(), key=lambda item: item[1][1], reverse=True)
+    return [f"{label:<50} {count:5d} waits  {total:8.2f}s"
+            for label, (count, total) in ranked[:limit]]
+
+
+class WaitPolicy:
+    """Explicit waits with per-call timeout overrides and zero-wait probes"""
+
+    def __init__(self, driver, timeout=10, poll_frequency=0.2):
+        self.driver = driver
+        self.timeout = timeout
+        self.poll_frequency = poll_frequency
+
+    def until(self, condition, timeout=None, message=""):
+        """Wait for condition, using the default timeout unless one is given"""
+        wait = WebDriverWait(self.driver, self.timeout if timeout is None else timeout,
+                             poll_frequency=self.poll_frequency)
+        label = _calling_page_method()
+        start = time.perf_counter()
+        try:
+            return wait.until(condition, message)
+        finally:
+            record_wait(label, time.perf_counter() - start)
+
+    def probe(self, locator):
+        """Elements matching locator right now - never waits"""
+        return self.driver.find_elements(*locator)
+
+    def probe_visible(self, locator):
+        """First displayed element matching locator right now, or None"""
+        for element in self.probe(locator):
+            if element.is_displayed():
+                return element
+        return None
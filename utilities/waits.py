@@ -0,0 +1,72 @@
+"""
+Custom wait conditions used by the page objects
+
+Each condition is a callable taking the driver, in the same style as
+selenium.webdriver.support.expected_conditions, so it can be passed to
+WebDriverWait.until.
+"""
+
+import time
+from selenium.webdriver.common.by import By
+
+
+class page_is_ready:
+    """document.readyState has reached 'complete'"""
+
+    def __call__(self, driver):
+        return driver.execute_script("return document.readyState") == "complete"
+
+
+class url_changed_from:
+    """Current URL differs from the URL captured before an action"""
+
+    def __init__(self, old_url):
+        self.old_url = old_url
+
+    def __call__(self, driver):
+        return driver.current_url != self.old_url
+
+
+class select_has_options:
+    """A <select> located by the locator has been populated with options"""
+
+    def __init__(self, locator):
+        self.locator = locator
+
+    def __call__(self, driver):
+        elements = driver.find_elements(*self.locator)
+        if not elements:
+            return False
+        return elements[0].find_elements(By.TAG_NAME, "option") or False
+
+
+class network_idle:
+    """No jQuery requests are pending and no new resources loaded for a quiet period"""
+
+    SCRIPT = """
+        return [
+            document.readyState,
+            window.jQuery ? window.jQuery.active : 0,
+            window.performance ? performance.getEntriesByType('resource').length : 0
+        ];
+    """
+
+    def __init__(self, quiet_period=0.5):
+        self.quiet_period = quiet_period
+        self._resource_count = None
+        self._quiet_since = None
+
+    def __call__(self, driver):
+        ready_state, active_requests, resource_count = driver.execute_script(self.SCRIPT)
+        now = time.monotonic()
+
+        if ready_state != "complete" or active_requests:
+            self._quiet_since = None
+            return False
+
+        if resource_count != self._resource_count or self._quiet_since is None:
+            self._resource_count = resource_count
+            self._quiet_since = now
+            return False
+
+        return now - self._quiet_since >= self.quiet_period